@@ -0,0 +1,79 @@
+"""
+In-process helpers that call CLI command functions directly.
+
+For tests that only check a command's output: skips Typer's argv parsing
+and CliRunner's stdio swapping. Tests of option parsing, usage errors or
+exit-code handling should keep using CliRunner.
+"""
+
+import contextlib
+import io
+from pathlib import Path
+from typing import Optional, Tuple
+
+import typer
+
+
+def run_simulate(
+    agent: Path,
+    policy: Path,
+    verbose: bool = False,
+    export: Optional[Path] = None,
+) -> Tuple[int, str]:
+    """Run ``simulate`` and return its exit code and captured stdout."""
+    # Imported here so collecting a test module doesn't load the CLI
+    from vault.cli.main import simulate
+    
+    buffer = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(buffer):
+        try:
+            simulate(agent=agent, policy=policy, verbose=verbose, export=export)
+        except typer.Exit as e:
+            exit_code = e.exit_code
+    return exit_code, buffer.getvalue()
+
+
+def run_redact(
+    input: Optional[Path],
+    policy: Path,
+    output: Optional[Path] = None,
+    agent: Optional[Path] = None,
+    json_output: bool = False,
+) -> Tuple[int, str]:
+    """Run ``redact`` and return its exit code and captured stdout."""
+    from vault.cli.main import redact
+    
+    buffer = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(buffer):
+        try:
+            # Every option is passed: the defaults are Typer OptionInfo objects
+            redact(
+                input=input,
+                policy=policy,
+                output=output,
+                agent=agent,
+                audit=None,
+                force=False,
+                json_output=json_output,
+                stream_log=None,
+            )
+        except SystemExit as e:
+            # redact exits through sys.exit rather than typer.Exit
+            exit_code = e.code
+    return exit_code, buffer.getvalue()
+
+
+def run_lint(policy: Path, strict: bool = False, quiet: bool = False) -> Tuple[int, str]:
+    """Run ``lint`` and return its exit code and captured stdout."""
+    from vault.cli.main import lint
+    
+    buffer = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(buffer):
+        try:
+            lint(policy=policy, strict=strict, quiet=quiet)
+        except typer.Exit as e:
+            exit_code = e.exit_code
+    return exit_code, buffer.getvalue()
@@ -10,6 +10,13 @@ import shutil
 # Store original working directory
 _original_cwd = os.getcwd()
 
+# Hand-run script that defines no tests but writes files into the working
+# directory when imported. Collecting it would do that once per xdist
+# worker, racing with the other workers' root pollution checks.
+collect_ignore = [
+    "security_hardening/test_large_file.py",
+]
+
 @pytest.fixture(autouse=True)
 def isolated_test_environment(tmp_path, monkeypatch):
     """
@@ -49,6 +56,22 @@ def project_root():
     """
     return Path(_original_cwd)
 
+@pytest.fixture(scope="session")
+def runner():
+    """
+    One CliRunner shared by every test that takes it.
+    """
+    from typer.testing import CliRunner
+    return CliRunner()
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    The vault Typer app, imported on first use rather than at collection.
+    """
+    from vault.cli.main import app as vault_app
+    return vault_app
+
 @pytest.fixture(autouse=True)
 def verify_no_root_pollution():
     """
@@ -35,18 +35,16 @@ def run_tests():
         print(f"\nRunning {test_file}...")
         print("-" * 50)
         
-        # Run pytest with verbose output
+        # Run pytest with verbose output; stderr is merged into the one pipe
         result = subprocess.run([
             sys.executable, "-m", "pytest", test_file, 
             "-v", 
             "--tb=short",
             "--no-header",
             "-q"
-        ], capture_output=True, text=True)
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
         
         print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
         
         if result.returncode != 0:
             all_passed = False
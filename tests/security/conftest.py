@@ -0,0 +1,16 @@
+"""
+Pytest configuration for the security tests.
+"""
+import pytest
+
+from vault.utils.security import clear_validation_cache
+
+@pytest.fixture(autouse=True)
+def fresh_validation_cache():
+    """
+    Start every test with empty validation caches, so tests that inspect
+    the caches see only their own entries.
+    """
+    clear_validation_cache()
+    yield
+    clear_validation_cache()
@@ -158,7 +158,7 @@ class TestExtremeValues:
         for value in small_values:
             result = validate_trust_score(value)
             assert result == value
-            assert isinstance(result, float)
+            assert type(result) is float
     
     def test_boundary_values(self):
         """Boundary values should be handled correctly."""
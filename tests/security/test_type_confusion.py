@@ -35,7 +35,7 @@ class TestTrustScoreTypeConfusion:
         for string_value, expected_float in test_cases:
             result = validate_trust_score(string_value)
             assert result == expected_float
-            assert isinstance(result, float), f"Expected float, got {type(result)}"
+            assert type(result) is float, f"Expected float, got {type(result)}"
     
     def test_string_comparison_vulnerability_prevented(self):
         """Prevent string comparison bypass attacks."""
@@ -46,8 +46,8 @@ class TestTrustScoreTypeConfusion:
         score1 = validate_trust_score("80")
         score2 = validate_trust_score("9")
         
-        assert isinstance(score1, float)
-        assert isinstance(score2, float)
+        assert type(score1) is float
+        assert type(score2) is float
         assert score1 > score2  # Numeric comparison works correctly
     
     def test_boolean_as_trustscore_rejected(self):
@@ -83,7 +83,7 @@ class TestTrustScoreTypeConfusion:
         
         # trustScore normalized to float
         assert result["trustScore"] == 95.0
-        assert isinstance(result["trustScore"], float)
+        assert type(result["trustScore"]) is float
         
         # Other types preserved
         assert result["verified"] is True
@@ -202,9 +202,49 @@ class TestTypeCoercionSecurity:
         validated = validate_agent_context(context)
         
         # Security fields normalized
-        assert isinstance(validated["trustScore"], float)
+        assert type(validated["trustScore"]) is float
         
         # Other fields preserve structure
         assert validated["metadata"]["tags"] == ["finance", "reports"]
         assert validated["metadata"]["active"] is True
-        assert validated["metadata"]["login_count"] == 42
\ No newline at end of file
+        assert validated["metadata"]["login_count"] == 42
+    
+    def test_cached_validation_keeps_types_apart(self):
+        """Memoized results must not let True/1 or int/str values collide."""
+        assert validate_trust_score(1) == 1.0
+        with pytest.raises(SecurityValidationError):
+            validate_trust_score(True)
+        
+        first = validate_agent_context({"role": "user", "trustScore": 80, "flag": 1})
+        second = validate_agent_context({"role": "user", "trustScore": 80, "flag": True})
+        assert first["flag"] == 1 and type(first["flag"]) is int
+        assert second["flag"] is True
+    
+    def test_cached_context_is_a_fresh_copy(self):
+        """Mutating a returned context must not leak into later calls."""
+        context = {"role": "user", "trustScore": 80}
+        
+        validated = validate_agent_context(context)
+        validated["role"] = "admin"
+        
+        assert validate_agent_context(context)["role"] == "user"
+    
+    def test_repeat_validation_logs_every_time(self, caplog):
+        """Security logging must not depend on whether a result was cached."""
+        caplog.set_level("INFO", logger="vault.utils.security.validators")
+        for _ in range(2):
+            validate_agent_context({"role": "\uff41dmin", "trustScore": 80})
+        
+        messages = [record.getMessage() for record in caplog.records]
+        assert sum("Unicode normalization applied" in m for m in messages) == 2
+        assert sum("High-privilege role requested" in m for m in messages) == 2
+    
+    def test_large_values_are_not_cached(self):
+        """Long untrusted strings are validated without being retained."""
+        from vault.utils.security import validators
+        
+        validators.clear_validation_cache()
+        validate_trust_score(" " * 1000 + "80")
+        validate_agent_context({"role": "user", "trustScore": 80, "notes": "x" * 5000})
+        assert validators._check_trust_score_cached.cache_info().currsize == 1
+        assert validators._check_role_cached.cache_info().currsize == 1
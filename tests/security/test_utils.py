@@ -34,10 +34,14 @@ def assert_validation_error(
     Raises:
         AssertionError: If expectations not met
     """
-    with pytest.raises(ValidationError) as exc_info:
+    # Plain try/except: only the exception object is needed, not pytest's
+    # ExceptionInfo/traceback capture
+    try:
         func(*args, **kwargs)
-    
-    error = exc_info.value
+    except ValidationError as e:
+        error = e
+    else:
+        pytest.fail(f"Expected ValidationError from {getattr(func, '__name__', func)!r}")
     
     # Check error code if specified
     if error_code is not None:
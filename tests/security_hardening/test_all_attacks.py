@@ -3,11 +3,19 @@
 Demonstrate all security fixes via CLI testing
 """
 
-import subprocess
 import json
 import os
 import sys
 
+import pytest
+
+# Make the project root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from typer.testing import CliRunner
+
+from vault.cli.main import app
+
 # Colors
 RED = '\033[91m'
 GREEN = '\033[92m'
@@ -15,31 +23,100 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 END = '\033[0m'
 
-def run_test(name, cmd, should_fail=True):
+# Shared encoder so each fixture write doesn't build a new one
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# Agent contexts for each case, built once and written out together
+FIXTURE_DIR = "test_security_hardening"
+ATTACK_AGENTS = {
+    "infinity": {"role": "admin", "trustScore": float('inf')},
+    "nan": {"role": "user", "trustScore": float('nan')},
+    "bool": {"role": "analyst", "trustScore": True},
+    "range": {"role": "manager", "trustScore": 150},
+    "negative": {"role": "user", "trustScore": -50},
+    "valid": {"role": "analyst", "trustScore": 85},
+    "missing_trust": {"role": "admin"},
+}
+
+def write_fixtures():
+    """Write every agent in ATTACK_AGENTS to FIXTURE_DIR/<name>.json."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name, agent in ATTACK_AGENTS.items():
+        with open(os.path.join(FIXTURE_DIR, f"{name}.json"), "w") as f:
+            f.write(_ENCODER.encode(agent))
+
+POLICY = "vault/templates/pii-basic.json"
+
+def _agent_path(name):
+    return f"{FIXTURE_DIR}/{name}.json"
+
+# (name, CLI args, should_fail) for each case, run in order
+CASES = [
+    ("Infinity trustScore attack",
+     ["simulate", "-a", _agent_path("infinity"), "-p", POLICY], True),
+    ("NaN trustScore attack",
+     ["simulate", "-a", _agent_path("nan"), "-p", POLICY], True),
+    ("Boolean trustScore type confusion",
+     ["simulate", "-a", _agent_path("bool"), "-p", POLICY], True),
+    ("Out of range trustScore (150)",
+     ["simulate", "-a", _agent_path("range"), "-p", POLICY], True),
+    ("Negative trustScore",
+     ["simulate", "-a", _agent_path("negative"), "-p", POLICY], True),
+    ("Valid agent",
+     ["simulate", "-a", _agent_path("valid"), "-p", POLICY], False),
+    ("Redact command with boolean trustScore",
+     ["redact", "-i", "examples/before.json", "-p", POLICY, "-g", _agent_path("bool")], True),
+    ("Missing trustScore (Bug #8 verification)",
+     ["simulate", "-a", _agent_path("missing_trust"), "-p", POLICY], True),
+]
+
+# Invoke the CLI in-process instead of starting an interpreter per case
+_RUNNER = CliRunner()
+
+def run_cli(args):
+    """Run a vault CLI command in-process."""
+    return _RUNNER.invoke(app, args)
+
+def run_test(name, args, should_fail=True):
     """Run a test and check if it behaves as expected"""
     print(f"\n{BLUE}Testing: {name}{END}")
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: vault {' '.join(args)}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_cli(args)
+    # result.output decodes the captured bytes on every access; do it once
+    output = result.output
     
     if should_fail:
-        if result.returncode != 0 and "Error" in result.stderr + result.stdout:
+        if result.exit_code != 0 and "Error" in output:
             print(f"{GREEN}PASS{END} - Attack blocked as expected")
-            error_msg = result.stderr.strip() or result.stdout.strip()
-            print(f"  Error: {error_msg}")
+            print(f"  Error: {output.strip()}")
             return True
         else:
             print(f"{RED}FAIL{END} - Attack was NOT blocked!")
             return False
     else:
-        if result.returncode == 0:
+        if result.exit_code == 0:
             print(f"{GREEN}PASS{END} - Valid input accepted")
             return True
         else:
             print(f"{RED}FAIL{END} - Valid input rejected!")
-            print(f"  Error: {result.stderr}")
+            print(f"  Error: {output}")
             return False
 
+@pytest.mark.parametrize(
+    "agent_name",
+    ["infinity", "nan", "bool", "range", "negative", "missing_trust"],
+)
+def test_simulate_rejects_malformed_agent(agent_name, tmp_path, project_root):
+    """Every malformed agent is rejected by simulate, all in one pytest process."""
+    agent_path = tmp_path / f"{agent_name}.json"
+    agent_path.write_text(_ENCODER.encode(ATTACK_AGENTS[agent_name]))
+    
+    result = run_cli(["simulate", "-a", str(agent_path), "-p", str(project_root / POLICY)])
+    
+    assert result.exit_code != 0
+    assert "Error" in result.output
+
 def main():
     print(f"{YELLOW}=== Marvis Vault Security Hardening Test ==={END}")
     print("Testing that all security vulnerabilities are now fixed\n")
@@ -47,111 +124,13 @@ def main():
     passed = 0
     total = 0
     
-    # Create test directory
-    os.makedirs("test_security_hardening", exist_ok=True)
-    
-    # Test 1: Infinity attack
-    with open("test_security_hardening/infinity.json", "w") as f:
-        json.dump({"role": "admin", "trustScore": float('inf')}, f)
-    
-    total += 1
-    if run_test(
-        "Infinity trustScore attack",
-        ["python3", "-m", "vault.cli.main", "simulate", 
-         "-a", "test_security_hardening/infinity.json",
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
-    
-    # Test 2: NaN attack
-    with open("test_security_hardening/nan.json", "w") as f:
-        json.dump({"role": "user", "trustScore": float('nan')}, f)
-    
-    total += 1
-    if run_test(
-        "NaN trustScore attack",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/nan.json",
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
-    
-    # Test 3: Boolean type confusion
-    with open("test_security_hardening/bool.json", "w") as f:
-        json.dump({"role": "analyst", "trustScore": True}, f)
-    
-    total += 1
-    if run_test(
-        "Boolean trustScore type confusion",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/bool.json", 
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
-    
-    # Test 4: Out of range
-    with open("test_security_hardening/range.json", "w") as f:
-        json.dump({"role": "manager", "trustScore": 150}, f)
-    
-    total += 1
-    if run_test(
-        "Out of range trustScore (150)",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/range.json",
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
-    
-    # Test 5: Negative trustScore
-    with open("test_security_hardening/negative.json", "w") as f:
-        json.dump({"role": "user", "trustScore": -50}, f)
-    
-    total += 1
-    if run_test(
-        "Negative trustScore",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/negative.json",
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
-    
-    # Test 6: Valid agent (should pass)
-    with open("test_security_hardening/valid.json", "w") as f:
-        json.dump({"role": "analyst", "trustScore": 85}, f)
-    
-    total += 1
-    if run_test(
-        "Valid agent",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/valid.json",
-         "-p", "vault/templates/pii-basic.json"],
-        should_fail=False
-    ):
-        passed += 1
-    
-    # Test 7: Redact with malformed agent
-    total += 1
-    if run_test(
-        "Redact command with boolean trustScore",
-        ["python3", "-m", "vault.cli.main", "redact",
-         "-i", "examples/before.json",
-         "-p", "vault/templates/pii-basic.json",
-         "-g", "test_security_hardening/bool.json"]
-    ):
-        passed += 1
-    
-    # Test 8: Missing trustScore (original bug #8)
-    with open("test_security_hardening/missing_trust.json", "w") as f:
-        json.dump({"role": "admin"}, f)
+    # Create test directory and agent files
+    write_fixtures()
     
-    total += 1
-    if run_test(
-        "Missing trustScore (Bug #8 verification)",
-        ["python3", "-m", "vault.cli.main", "simulate",
-         "-a", "test_security_hardening/missing_trust.json",
-         "-p", "vault/templates/pii-basic.json"]
-    ):
-        passed += 1
+    for name, args, should_fail in CASES:
+        total += 1
+        if run_test(name, args, should_fail):
+            passed += 1
     
     # Summary
     print(f"\n{YELLOW}=== Test Summary ==={END}")
@@ -1,14 +1,11 @@
 #!/usr/bin/env python3
 """Generate a large JSON file to test size limits"""
 
-import json
-
-# Create 11MB of data (exceeds 10MB limit)
-large_data = {
-    "role": "user",
-    "trustScore": 50,
-    "data": "A" * (11 * 1024 * 1024)  # 11MB of 'A's
-}
-
-with open("test_large.json", "w") as f:
-    json.dump(large_data, f)
\ No newline at end of file
+# Create 11MB of data (exceeds 10MB limit). The payload is written as raw
+# bytes from one reusable 64KB buffer, so nothing is built up or re-encoded.
+with open("test_large.json", "wb") as f:
+    f.write(b'{"role":"user","trustScore":50,"data":"')
+    chunk = b"A" * 65536
+    for _ in range(11 * 1024 * 1024 // len(chunk)):  # 11MB of 'A's
+        f.write(chunk)
+    f.write(b'"}')
@@ -0,0 +1,247 @@
+"""
+Tests for the audit command.
+"""
+
+import pytest
+import typer
+from typer.testing import CliRunner
+from vault.cli.main import app
+from vault.audit.audit_logger import rotate_log
+from vault.cli.audit import read_audit_log, tail_audit_log, export_csv, export_json
+from pathlib import Path
+import io
+import json
+import os
+import threading
+
+runner = CliRunner()
+
+LOG_ENTRIES = [
+    {
+        "timestamp": "2024-03-03T10:00:00Z",
+        "action": "redact",
+        "role": "admin",
+        "field": "ssn",
+        "input": "123-45-6789",
+        "output": "[REDACTED]"
+    },
+    {
+        "timestamp": "2024-03-03T10:01:00Z",
+        "action": "unmask",
+        "role": "analyst",
+        "field": "email",
+        "input": "a@example.com",
+        "output": "a@example.com"
+    },
+]
+
+# An entry missing required fields, and the JSON lines the fixtures write,
+# built once at import rather than in every fixture
+INCOMPLETE_ENTRY = {"timestamp": "2024-03-03T10:02:00Z", "action": "redact"}
+LOG_LINES = [json.dumps(e) for e in LOG_ENTRIES]
+INCOMPLETE_LINE = json.dumps(INCOMPLETE_ENTRY)
+
+def write_log(path: Path, lines) -> Path:
+    """Write all log lines with a single call."""
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+@pytest.fixture
+def valid_log(tmp_path):
+    """Create a JSONL audit log with only valid entries."""
+    return write_log(tmp_path / "audit.jsonl", LOG_LINES)
+
+@pytest.fixture
+def incomplete_log(tmp_path):
+    """Create a JSONL audit log where one entry lacks required fields."""
+    return write_log(tmp_path / "incomplete.jsonl", [LOG_LINES[0], INCOMPLETE_LINE])
+
+@pytest.fixture
+def malformed_log_path(tmp_path):
+    """Create a JSONL audit log mixing valid and malformed lines."""
+    return write_log(tmp_path / "malformed.jsonl", [
+        LOG_LINES[0],
+        "invalid json",
+        LOG_LINES[1],
+        '{"missing": "fields"}',
+        "[1, 2]",
+    ])
+
+def test_read_audit_log_valid(valid_log):
+    """Test reading a log with only valid entries."""
+    entries = read_audit_log(valid_log)
+    assert entries == LOG_ENTRIES
+
+def test_read_audit_log_incomplete(incomplete_log):
+    """Test that entries missing required fields are skipped."""
+    entries = read_audit_log(incomplete_log)
+    assert entries == LOG_ENTRIES[:1]
+
+def test_read_audit_log_malformed_lines(malformed_log_path):
+    """Test that malformed lines are skipped without aborting the read."""
+    entries = read_audit_log(malformed_log_path)
+    assert entries == LOG_ENTRIES
+
+def test_tail_audit_log_resumes(valid_log):
+    """Test that a tail read only returns entries appended since the last one."""
+    entries, position = tail_audit_log(valid_log)
+    assert entries == LOG_ENTRIES
+    assert position == (valid_log.stat().st_ino, valid_log.stat().st_size)
+    assert tail_audit_log(valid_log, position) == ([], position)
+    
+    with valid_log.open("a") as f:
+        f.write(INCOMPLETE_LINE + "\n" + LOG_LINES[0] + "\n")
+    entries, position = tail_audit_log(valid_log, position)
+    assert entries == LOG_ENTRIES[:1]
+    assert position[1] == valid_log.stat().st_size
+
+def test_tail_audit_log_waits_for_a_complete_line(valid_log):
+    """Test that a line still being written is read again once complete."""
+    with valid_log.open("a") as f:
+        f.write(LOG_LINES[0][:10])
+    _, position = tail_audit_log(valid_log)
+    with valid_log.open("a") as f:
+        f.write(LOG_LINES[0][10:] + "\n")
+    assert tail_audit_log(valid_log, position)[0] == LOG_ENTRIES[:1]
+
+@pytest.mark.parametrize("offset", [10_000, 1], ids=["past-end", "mid-line"])
+def test_tail_audit_log_rewritten_in_place(valid_log, offset):
+    """Test that a position that no longer fits the file restarts the read."""
+    position = (valid_log.stat().st_ino, offset)
+    assert tail_audit_log(valid_log, position)[0] == LOG_ENTRIES
+
+def test_tail_audit_log_drains_rotated_generation(valid_log):
+    """Test that a rotation of the same length neither skips nor loses entries."""
+    first_line = len(LOG_LINES[0]) + 1
+    position = (valid_log.stat().st_ino, first_line)
+    # The new log has the same length, and a newline at the old offset
+    rotate_log(valid_log)
+    write_log(valid_log, LOG_LINES)
+    
+    entries, position = tail_audit_log(valid_log, position)
+    assert entries == LOG_ENTRIES[1:] + LOG_ENTRIES
+    assert position == (valid_log.stat().st_ino, valid_log.stat().st_size)
+
+def test_tail_audit_log_replaced(valid_log, tmp_path):
+    """Test that a log replaced without a matching rotation is read from the start."""
+    position = (valid_log.stat().st_ino, len(LOG_LINES[0]) + 1)
+    replacement = write_log(tmp_path / "replacement.jsonl", LOG_LINES)
+    replacement.replace(valid_log)
+    assert tail_audit_log(valid_log, position)[0] == LOG_ENTRIES
+
+def test_read_audit_log_missing_file(tmp_path):
+    """Test that a missing log file is reported."""
+    with pytest.raises(typer.BadParameter, match="Audit log file not found"):
+        read_audit_log(tmp_path / "nonexistent.jsonl")
+
+def test_audit_valid_logfile(valid_log):
+    """Test audit command summary output."""
+    result = runner.invoke(app, ["audit", "--log", str(valid_log)])
+    assert result.exit_code == 0
+    assert "Total Entries: 2" in result.stdout
+    assert "Unique Roles: 2" in result.stdout
+
+def test_audit_malformed_lines(malformed_log_path):
+    """Test audit command warns about skipped lines."""
+    result = runner.invoke(app, ["audit", "--log", str(malformed_log_path)])
+    assert result.exit_code == 0
+    assert "Skipped 3 malformed lines" in result.stdout
+    assert "Total Entries: 2" in result.stdout
+
+def test_audit_export_csv(valid_log, tmp_path):
+    """Test CSV export with a role filter."""
+    output = tmp_path / "audit.csv"
+    result = runner.invoke(app, ["audit", "--log", str(valid_log), "--role", "ANALYST", "--export", str(output)])
+    assert result.exit_code == 0
+    lines = output.read_text().splitlines()
+    assert lines[0] == "timestamp,action,role,field,input,output"
+    assert lines[1:] == ["2024-03-03T10:01:00Z,unmask,analyst,email,a@example.com,a@example.com"]
+
+def test_audit_export_csv_failed_read_keeps_output(tmp_path):
+    """Test that a log that fails to read leaves the export file untouched."""
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    bad_log = export_dir / "bad.json"
+    bad_log.write_text("{not json")
+    output = export_dir / "out.csv"
+    output.write_text("previous export\n")
+    result = runner.invoke(app, ["audit", "--log", str(bad_log), "--export", str(output)])
+    assert result.exit_code == 1
+    assert output.read_text() == "previous export\n"
+    assert sorted(p.name for p in export_dir.iterdir()) == ["bad.json", "out.csv"]
+
+def failing_after(entries):
+    """Yield ``entries``, then fail the way a log that breaks partway does."""
+    yield from entries
+    raise typer.BadParameter("Error reading audit log")
+
+def test_export_csv_stdout_streams_rows(capsys):
+    """Test that rows reach stdout as they are read, not after the last one."""
+    with pytest.raises(typer.BadParameter):
+        export_csv(failing_after(LOG_ENTRIES[:1]), "-")
+    assert capsys.readouterr().out.splitlines() == [
+        "timestamp,action,role,field,input,output",
+        "2024-03-03T10:00:00Z,redact,admin,ssn,123-45-6789,[REDACTED]",
+    ]
+
+def test_export_csv_stdout_known_failure_writes_nothing(capsys):
+    """Test that a read failing before the first entry leaves stdout empty."""
+    with pytest.raises(typer.BadParameter):
+        export_csv(failing_after([]), "-")
+    assert capsys.readouterr().out == ""
+
+def test_export_csv_keeps_symlink_and_mode(tmp_path):
+    """Test that an export through a symlink replaces the target, not the link."""
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    target = export_dir / "target.csv"
+    target.write_text("previous export\n")
+    target.chmod(0o640)
+    link = export_dir / "latest.csv"
+    link.symlink_to(target)
+    
+    export_csv(LOG_ENTRIES, link)
+    assert link.is_symlink()
+    assert target.read_text().splitlines()[0] == "timestamp,action,role,field,input,output"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in export_dir.iterdir()) == ["latest.csv", "target.csv"]
+
+def test_export_csv_to_fifo(tmp_path):
+    """Test that a FIFO is written in place rather than replaced."""
+    fifo = tmp_path / "export.fifo"
+    os.mkfifo(fifo)
+    received = []
+    reader = threading.Thread(target=lambda: received.append(fifo.read_text()))
+    reader.start()
+    export_csv(LOG_ENTRIES, fifo)
+    reader.join(timeout=5)
+    assert fifo.is_fifo()
+    assert received[0].splitlines()[1:] == [
+        "2024-03-03T10:00:00Z,redact,admin,ssn,123-45-6789,[REDACTED]",
+        "2024-03-03T10:01:00Z,unmask,analyst,email,a@example.com,a@example.com",
+    ]
+
+def test_audit_export_json(valid_log, tmp_path):
+    """Test JSON export round-trips the entries."""
+    output = tmp_path / "audit.json"
+    result = runner.invoke(app, ["audit", "--log", str(valid_log), "--json-out", str(output)])
+    assert result.exit_code == 0
+    assert json.loads(output.read_text()) == LOG_ENTRIES
+
+def test_export_json_matches_standard_library():
+    """Test that JSON export escapes non-ASCII and keeps NaN, whatever is installed."""
+    entries = [{**LOG_ENTRIES[0], "role": "m\u00e9decin", "input": float("nan")}]
+    buffer = io.StringIO()
+    export_json(entries, buffer)
+    assert buffer.getvalue() == json.dumps(entries, indent=2)
+    assert "m\\u00e9decin" in buffer.getvalue()
+    assert "NaN" in buffer.getvalue()
+
+def test_export_csv_blanks_missing_columns():
+    """Test that entries missing columns export with empty cells."""
+    buffer = io.StringIO()
+    export_csv([INCOMPLETE_ENTRY], buffer)
+    assert buffer.getvalue().splitlines() == [
+        "timestamp,action,role,field,input,output",
+        "2024-03-03T10:02:00Z,redact,,,,",
+    ]
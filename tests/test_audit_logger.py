@@ -0,0 +1,85 @@
+"""
+Tests for the audit logger.
+"""
+
+import json
+import pytest
+from vault.audit import audit_logger
+
+def test_format_timestamp_follows_the_clock(monkeypatch):
+    """Test that the cached second is replaced when the clock moves on."""
+    now = [1_700_000_000_250_000_000]
+    monkeypatch.setattr(audit_logger.time, "time_ns", lambda: now[0])
+    assert audit_logger.format_timestamp() == "2023-11-14T22:13:20.250000Z"
+    now[0] += 1_000_000_000
+    assert audit_logger.format_timestamp() == "2023-11-14T22:13:21.250000Z"
+    now[0] += 750_000_000
+    assert audit_logger.format_timestamp() == "2023-11-14T22:13:22Z"
+    assert audit_logger._second_cache == (1_700_000_002, "2023-11-14T22:13:22")
+
+def test_rotation_keeps_every_generation(tmp_path, monkeypatch):
+    """Test that each rotation moves the log to a new generation."""
+    log_path = tmp_path / "vault.log"
+    monkeypatch.setenv("VAULT_LOG_PATH", str(log_path))
+    monkeypatch.setattr(audit_logger, "ROTATE_AT_BYTES", 1)
+    agent = {"role": "analyst", "trustScore": 80}
+    for field in ("email", "ssn", "phone"):
+        audit_logger.log_event("redact", field, agent, "masked")
+    
+    assert not log_path.exists()
+    for generation, field in enumerate(("email", "ssn", "phone"), 1):
+        rotated = tmp_path / f"vault.log.{generation}"
+        assert json.loads(rotated.read_text())["field"] == field
+
+@pytest.mark.parametrize("agent", [
+    {"role": "m\u00e9decin", "trustScore": 80},
+    {"role": "analyst", "trustScore": float("nan")},
+    {"role": "analyst", "trustScore": 2**70},
+], ids=["non-ascii", "nan", "wide-int"])
+def test_log_line_matches_standard_library(tmp_path, monkeypatch, agent):
+    """Test that logged bytes are stdlib json whether or not orjson is installed."""
+    log_path = tmp_path / "vault.log"
+    monkeypatch.setenv("VAULT_LOG_PATH", str(log_path))
+    audit_logger.log_event("redact", "email", agent, "masked")
+    
+    line = log_path.read_text(encoding="utf-8")
+    entry = json.loads(line)
+    assert line == json.dumps(entry) + "\n"
+    assert line.isascii()
+
+def test_rotate_log_never_overwrites(tmp_path):
+    """Test that an existing generation is skipped, not replaced."""
+    log_path = tmp_path / "vault.log"
+    log_path.write_text("new\n")
+    (tmp_path / "vault.log.1").write_text("old\n")
+    assert audit_logger.rotate_log(log_path) == tmp_path / "vault.log.2"
+    assert (tmp_path / "vault.log.1").read_text() == "old\n"
+    assert (tmp_path / "vault.log.2").read_text() == "new\n"
+
+def test_rotate_log_already_rotated(tmp_path):
+    """Test that a log another writer already moved is left alone."""
+    assert audit_logger.rotate_log(tmp_path / "vault.log") is None
+
+def test_rotate_log_goes_above_highest_generation(tmp_path):
+    """Test that a new generation is numbered above every existing one."""
+    log_path = tmp_path / "vault.log"
+    log_path.write_text("new\n")
+    (tmp_path / "vault.log.5").write_text("old\n")
+    (tmp_path / "vault.log.backup").write_text("other\n")
+    assert audit_logger.rotate_log(log_path) == tmp_path / "vault.log.6"
+
+def test_failed_rotation_keeps_the_event(tmp_path, monkeypatch):
+    """Test that a rotation error warns instead of failing a written event."""
+    log_path = tmp_path / "vault.log"
+    monkeypatch.setenv("VAULT_LOG_PATH", str(log_path))
+    monkeypatch.setattr(audit_logger, "ROTATE_AT_BYTES", 1)
+    def no_links(src, dst):
+        raise PermissionError(1, "Operation not permitted")
+    monkeypatch.setattr(audit_logger.os, "link", no_links)
+    agent = {"role": "analyst", "trustScore": 80}
+    for field in ("email", "ssn"):
+        with pytest.warns(UserWarning, match="Failed to rotate audit log"):
+            audit_logger.log_event("redact", field, agent, "masked")
+    
+    fields = [json.loads(line)["field"] for line in log_path.read_text().splitlines()]
+    assert fields == ["email", "ssn"]
@@ -3,13 +3,12 @@ Comprehensive CLI tests using realistic data with current parser format.
 """
 
 import json
-import os
 import tempfile
 from pathlib import Path
-from typer.testing import CliRunner
 import pytest
 
-from vault.cli.main import app
+from tests._fast_cli import run_simulate
+from vault.sdk.redact import redact
 from tests.fixtures.realistic_test_data import (
     ADMIN_AGENT,
     USER_LOW_TRUST,
@@ -26,42 +25,82 @@ from tests.fixtures.compatible_policies import (
     TEST_POLICIES
 )
 
-runner = CliRunner()
+
+def _repeat_patients_json(records, times):
+    """json.dumps of records with its patients list repeated ``times`` times.
+    
+    The patients are encoded once and the copies are joined as text, instead
+    of building the repeated list and walking every copy in the encoder.
+    """
+    placeholder = json.dumps("__patients__")
+    envelope = json.dumps({**records, "patients": "__patients__"})
+    patients = ", ".join(json.dumps(patient) for patient in records["patients"])
+    return envelope.replace(placeholder, "[" + ", ".join([patients] * times) + "]", 1)
+
+
+@pytest.fixture(scope="session")
+def fixture_json():
+    """Fixture payloads serialized once per session instead of in every test."""
+    payloads = {
+        "admin_agent": ADMIN_AGENT,
+        "user_low_trust": USER_LOW_TRUST,
+        "contractor_minimal": CONTRACTOR_MINIMAL,
+        "missing_trustscore": MISSING_TRUSTSCORE,
+        "financial_transactions": FINANCIAL_TRANSACTIONS,
+        "employee_records": EMPLOYEE_RECORDS,
+        "healthcare_policy": HEALTHCARE_COMPATIBLE,
+        "financial_policy": FINANCIAL_COMPATIBLE,
+        "hr_policy": HR_COMPATIBLE,
+        "minimal_policy": TEST_POLICIES["minimal"],
+        "complex_conditions_policy": TEST_POLICIES["complex_conditions"],
+    }
+    serialized = {name: json.dumps(obj) for name, obj in payloads.items()}
+    # 150 patients for the performance test
+    serialized["large_healthcare_records"] = _repeat_patients_json(HEALTHCARE_RECORDS, 50)
+    return serialized
+
+
+@pytest.fixture(scope="session")
+def canonical_inputs(tmp_path_factory, fixture_json):
+    """Read-only input files written once per session, keyed by payload name.
+    
+    Only for tests that never modify their inputs; outputs still go to tmp_path.
+    """
+    directory = tmp_path_factory.mktemp("canonical_inputs")
+    paths = {}
+    for name in ("admin_agent", "healthcare_policy", "large_healthcare_records"):
+        path = directory / f"{name}.json"
+        path.write_text(fixture_json[name])
+        paths[name] = path
+    return paths
+
 
 class TestCLIWithRealisticData:
     """Test CLI commands with production-quality data."""
     
-    def test_simulate_healthcare_admin(self, tmp_path):
+    def test_simulate_healthcare_admin(self, canonical_inputs):
         """Test healthcare simulation with admin access."""
-        # Write files
-        agent_file = tmp_path / "admin.json"
-        policy_file = tmp_path / "healthcare.json"
+        agent_file = canonical_inputs["admin_agent"]
+        policy_file = canonical_inputs["healthcare_policy"]
         
-        agent_file.write_text(json.dumps(ADMIN_AGENT))
-        policy_file.write_text(json.dumps(HEALTHCARE_COMPATIBLE))
+        exit_code, stdout = run_simulate(agent_file, policy_file)
         
-        result = runner.invoke(app, [
-            "simulate",
-            "-a", str(agent_file),
-            "-p", str(policy_file)
-        ])
-        
-        if result.exit_code != 0:
-            print(f"CLI Error: {result.stdout}")
-        assert result.exit_code == 0
-        assert "admin" in result.stdout
-        assert "Unmasked for role 'admin'" in result.stdout
+        if exit_code != 0:
+            print(f"CLI Error: {stdout}")
+        assert exit_code == 0
+        assert "admin" in stdout
+        assert "Unmasked for role 'admin'" in stdout
     
-    def test_redact_financial_low_trust(self, tmp_path):
+    def test_redact_financial_low_trust(self, tmp_path, fixture_json, app, runner):
         """Test financial data redaction with low trust user."""
         agent_file = tmp_path / "user.json"
         content_file = tmp_path / "financial.json"
         policy_file = tmp_path / "finance.json"
         output_file = tmp_path / "output.json"
         
-        agent_file.write_text(json.dumps(USER_LOW_TRUST))
-        content_file.write_text(json.dumps(FINANCIAL_TRANSACTIONS))
-        policy_file.write_text(json.dumps(FINANCIAL_COMPATIBLE))
+        agent_file.write_text(fixture_json["user_low_trust"])
+        content_file.write_text(fixture_json["financial_transactions"])
+        policy_file.write_text(fixture_json["financial_policy"])
         
         result = runner.invoke(app, [
             "redact",
@@ -81,29 +120,19 @@ class TestCLIWithRealisticData:
         assert result.exit_code == 0
         assert output_file.exists()
         
-        # Check redacted content
-        redacted = json.loads(output_file.read_text())
-        
-        # Financial data should be redacted for low trust
-        assert "[REDACTED]" in json.dumps(redacted)
+        # Financial data should be redacted for low trust; only presence
+        # matters, so search the text rather than parsing it
+        assert "[REDACTED]" in output_file.read_text()
     
-    def test_simulate_export_json(self, tmp_path):
+    def test_simulate_export_json(self, tmp_path, canonical_inputs):
         """Test export functionality with healthcare data."""
-        agent_file = tmp_path / "admin.json" 
-        policy_file = tmp_path / "healthcare.json"
+        agent_file = canonical_inputs["admin_agent"]
+        policy_file = canonical_inputs["healthcare_policy"]
         export_file = tmp_path / "export.json"
         
-        agent_file.write_text(json.dumps(ADMIN_AGENT))
-        policy_file.write_text(json.dumps(HEALTHCARE_COMPATIBLE))
+        exit_code, _ = run_simulate(agent_file, policy_file, export=export_file)
         
-        result = runner.invoke(app, [
-            "simulate",
-            "-a", str(agent_file),
-            "-p", str(policy_file),
-            "-e", str(export_file)
-        ])
-        
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert export_file.exists()
         
         # Verify export content
@@ -112,13 +141,13 @@ class TestCLIWithRealisticData:
         assert export_data["context_summary"]["role"] == "admin"
         assert export_data["context_summary"]["trustScore"] == 95
     
-    def test_missing_trustscore_handling(self, tmp_path):
+    def test_missing_trustscore_handling(self, tmp_path, fixture_json, app, runner):
         """Test graceful handling of missing trustScore."""
         agent_file = tmp_path / "missing.json"
         policy_file = tmp_path / "policy.json"
         
-        agent_file.write_text(json.dumps(MISSING_TRUSTSCORE))
-        policy_file.write_text(json.dumps(TEST_POLICIES["minimal"]))
+        agent_file.write_text(fixture_json["missing_trustscore"])
+        policy_file.write_text(fixture_json["minimal_policy"])
         
         result = runner.invoke(app, [
             "simulate",
@@ -131,16 +160,16 @@ class TestCLIWithRealisticData:
         # Should show restrictive access
         assert "REDACTED" in result.stdout or "condition" in result.stdout.lower()
     
-    def test_contractor_hr_access(self, tmp_path):
+    def test_contractor_hr_access(self, tmp_path, fixture_json, app, runner):
         """Test contractor cannot access HR data."""
         agent_file = tmp_path / "contractor.json"
         content_file = tmp_path / "employees.json"
         policy_file = tmp_path / "hr.json"
         output_file = tmp_path / "contractor_view.json"
         
-        agent_file.write_text(json.dumps(CONTRACTOR_MINIMAL))
-        content_file.write_text(json.dumps(EMPLOYEE_RECORDS))
-        policy_file.write_text(json.dumps(HR_COMPATIBLE))
+        agent_file.write_text(fixture_json["contractor_minimal"])
+        content_file.write_text(fixture_json["employee_records"])
+        policy_file.write_text(fixture_json["hr_policy"])
         
         result = runner.invoke(app, [
             "redact",
@@ -155,56 +184,45 @@ class TestCLIWithRealisticData:
         assert output_file.exists()
         
         # Verify sensitive data is redacted
-        redacted = json.loads(output_file.read_text())
-        content_str = json.dumps(redacted)
-        
-        # Count redactions
-        redaction_count = content_str.count("[REDACTED]")
+        redaction_count = output_file.read_text().count("[REDACTED]")
         assert redaction_count > 5  # Should have many redactions
     
-    def test_output_directory_enforcement(self, tmp_path):
+    def test_output_directory_enforcement(self, tmp_path, fixture_json, app, monkeypatch, runner):
         """Ensure no files are created outside test directory."""
-        # Save current directory
-        original_cwd = os.getcwd()
-        
-        # Create test workspace
+        # Create test workspace; monkeypatch restores the cwd afterwards
         workspace = tmp_path / "workspace"
         workspace.mkdir()
-        os.chdir(workspace)
-        
-        try:
-            # Run a simulate command
-            agent_file = workspace / "agent.json"
-            policy_file = workspace / "policy.json"
-            export_file = workspace / "export.json"
-            
-            agent_file.write_text(json.dumps({"role": "user", "trustScore": 50}))
-            policy_file.write_text(json.dumps(TEST_POLICIES["minimal"]))
-            
-            result = runner.invoke(app, [
-                "simulate",
-                "-a", str(agent_file),
-                "-p", str(policy_file),
-                "-e", str(export_file)
-            ])
-            
-            assert result.exit_code == 0
-            
-            # Check only expected files exist
-            files = list(workspace.iterdir())
-            expected = {"agent.json", "policy.json", "export.json"}
-            actual = {f.name for f in files}
-            
-            assert actual == expected, f"Unexpected files: {actual - expected}"
-            
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(workspace)
+        
+        # Run a simulate command
+        agent_file = workspace / "agent.json"
+        policy_file = workspace / "policy.json"
+        export_file = workspace / "export.json"
+        
+        agent_file.write_text(json.dumps({"role": "user", "trustScore": 50}))
+        policy_file.write_text(fixture_json["minimal_policy"])
+        
+        result = runner.invoke(app, [
+            "simulate",
+            "-a", str(agent_file),
+            "-p", str(policy_file),
+            "-e", str(export_file)
+        ])
+        
+        assert result.exit_code == 0
+        
+        # Check only expected files exist
+        files = list(workspace.iterdir())
+        expected = {"agent.json", "policy.json", "export.json"}
+        actual = {f.name for f in files}
+        
+        assert actual == expected, f"Unexpected files: {actual - expected}"
 
 
 class TestCLIEdgeCases:
     """Test CLI edge cases and error handling."""
     
-    def test_malformed_agent_rejection(self, tmp_path):
+    def test_malformed_agent_rejection(self, tmp_path, fixture_json, app, runner):
         """Test that malformed agents are properly rejected."""
         agent_file = tmp_path / "bad_agent.json"
         policy_file = tmp_path / "policy.json"
@@ -216,7 +234,7 @@ class TestCLIEdgeCases:
         }
         
         agent_file.write_text(json.dumps(bad_agent))
-        policy_file.write_text(json.dumps(TEST_POLICIES["minimal"]))
+        policy_file.write_text(fixture_json["minimal_policy"])
         
         result = runner.invoke(app, [
             "simulate",
@@ -228,12 +246,8 @@ class TestCLIEdgeCases:
         assert result.exit_code != 0
         assert "error" in result.stdout.lower()
     
-    def test_nested_field_redaction(self, tmp_path):
+    def test_nested_field_redaction(self):
         """Test redaction of deeply nested fields."""
-        agent_file = tmp_path / "doctor.json"
-        content_file = tmp_path / "patients.json"
-        policy_file = tmp_path / "nested.json"
-        
         doctor_agent = {
             "role": "doctor",
             "trustScore": 88,
@@ -256,28 +270,15 @@ class TestCLIEdgeCases:
             }
         }
         
-        agent_file.write_text(json.dumps(doctor_agent))
-        content_file.write_text(json.dumps(nested_data))
-        policy_file.write_text(json.dumps(TEST_POLICIES["nested_fields"]))
-        
-        result = runner.invoke(app, [
-            "redact",
-            "-a", str(agent_file),
-            "-d", str(content_file),
-            "-p", str(policy_file),
-            "-f", "json"
-        ])
-        
-        assert result.exit_code == 0
-        
-        # Parse output
-        output = json.loads(result.stdout)
+        # Policy semantics only: call the redactor directly, no CLI round trip
+        result = redact(json.dumps(nested_data), TEST_POLICIES["nested_fields"], doctor_agent)
+        output = json.loads(result.content)
         
         # Doctor should see diagnosis but not SSN
         assert output["patient"]["medical"]["diagnosis"] != "[REDACTED]"
         assert output["patient"]["demographics"]["ssn"] == "[REDACTED]"
     
-    def test_complex_condition_evaluation(self, tmp_path):
+    def test_complex_condition_evaluation(self, tmp_path, fixture_json):
         """Test complex multi-part conditions."""
         agent_file = tmp_path / "manager.json"
         policy_file = tmp_path / "complex.json"
@@ -290,40 +291,27 @@ class TestCLIEdgeCases:
         }
         
         agent_file.write_text(json.dumps(manager_agent))
-        policy_file.write_text(json.dumps(TEST_POLICIES["complex_conditions"]))
+        policy_file.write_text(fixture_json["complex_conditions_policy"])
         
-        result = runner.invoke(app, [
-            "simulate",
-            "-a", str(agent_file),
-            "-p", str(policy_file),
-            "-v"  # Verbose
-        ])
+        exit_code, stdout = run_simulate(agent_file, policy_file, verbose=True)
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         
         # Should show condition evaluation
-        assert "manager" in result.stdout
-        assert "82" in result.stdout  # trustScore
+        assert "manager" in stdout
+        assert "82" in stdout  # trustScore
 
 
 class TestCLIPerformance:
     """Test CLI performance with large datasets."""
     
-    def test_large_healthcare_dataset(self, tmp_path):
+    def test_large_healthcare_dataset(self, tmp_path, canonical_inputs, app, runner):
         """Test performance with many patient records."""
-        agent_file = tmp_path / "admin.json"
-        content_file = tmp_path / "large_patients.json"
-        policy_file = tmp_path / "healthcare.json"
+        agent_file = canonical_inputs["admin_agent"]
+        content_file = canonical_inputs["large_healthcare_records"]
+        policy_file = canonical_inputs["healthcare_policy"]
         output_file = tmp_path / "large_output.json"
         
-        # Create large dataset
-        large_data = HEALTHCARE_RECORDS.copy()
-        large_data["patients"] = large_data["patients"] * 50  # 150 patients
-        
-        agent_file.write_text(json.dumps(ADMIN_AGENT))
-        content_file.write_text(json.dumps(large_data))
-        policy_file.write_text(json.dumps(HEALTHCARE_COMPATIBLE))
-        
         import time
         start = time.time()
         
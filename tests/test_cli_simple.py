@@ -5,6 +5,8 @@ from typer.testing import CliRunner
 from vault.cli.main import app
 from pathlib import Path
 
+from tests._fast_cli import run_redact, run_simulate
+
 runner = CliRunner()
 
 # Simple test data that won't trigger overly aggressive injection detection
@@ -26,41 +28,56 @@ SIMPLE_CONTENT = {
     "phone": "555-0123"
 }
 
+LOW_TRUST_AGENT = {
+    "role": "user",
+    "trustScore": 40
+}
+
+# Serialized once at import; the tests that need their own agent file
+# write these bytes instead of re-encoding the dict
+_LOW_TRUST_AGENT_JSON = json.dumps(LOW_TRUST_AGENT).encode()
+
+
+@pytest.fixture(scope="session")
+def simple_files(tmp_path_factory):
+    """Read-only agent, policy and content files written once per session.
+    
+    Tests that need a different input write their own copy to tmp_path.
+    """
+    directory = tmp_path_factory.mktemp("simple_inputs")
+    paths = {}
+    for name, data in (("agent", SIMPLE_AGENT), ("policy", SIMPLE_POLICY), ("content", SIMPLE_CONTENT)):
+        path = directory / f"{name}.json"
+        path.write_bytes(json.dumps(data).encode())
+        paths[name] = path
+    return paths
+
 
 class TestSimpleCLI:
     """Test CLI with simple, safe data."""
     
-    def test_simulate_simple(self, tmp_path):
+    def test_simulate_simple(self, simple_files):
         """Test basic simulate functionality."""
-        # Write test files
-        agent_file = tmp_path / "agent.json"
-        policy_file = tmp_path / "policy.json"
-        
-        agent_file.write_text(json.dumps(SIMPLE_AGENT))
-        policy_file.write_text(json.dumps(SIMPLE_POLICY))
+        agent_file = simple_files["agent"]
+        policy_file = simple_files["policy"]
         
         # Run simulate
         result = runner.invoke(app, [
             "simulate",
             "-a", str(agent_file),
             "-p", str(policy_file)
-        ])
+        ], catch_exceptions=False)
         
         assert result.exit_code == 0
         # Output format has changed, just check it succeeded
         
-    def test_redact_simple(self, tmp_path):
+    def test_redact_simple(self, tmp_path, simple_files):
         """Test basic redact functionality."""
-        # Write test files
-        agent_file = tmp_path / "agent.json"
-        policy_file = tmp_path / "policy.json"
-        content_file = tmp_path / "content.json"
+        agent_file = simple_files["agent"]
+        policy_file = simple_files["policy"]
+        content_file = simple_files["content"]
         output_file = tmp_path / "output.json"
         
-        agent_file.write_text(json.dumps(SIMPLE_AGENT))
-        policy_file.write_text(json.dumps(SIMPLE_POLICY))
-        content_file.write_text(json.dumps(SIMPLE_CONTENT))
-        
         # Run redact
         result = runner.invoke(app, [
             "redact",
@@ -68,7 +85,7 @@ class TestSimpleCLI:
             "-p", str(policy_file),
             "-i", str(content_file),
             "-o", str(output_file)
-        ])
+        ], catch_exceptions=False)
         
         assert result.exit_code == 0
         assert output_file.exists()
@@ -81,40 +98,27 @@ class TestSimpleCLI:
         assert output["ssn"] == "123-45-6789"
         assert output["email"] == "john@example.com"
         
-    def test_redact_with_masking(self, tmp_path):
+    def test_redact_with_masking(self, tmp_path, simple_files):
         """Test redaction with actual masking."""
         # Use a low trust user
-        low_trust_agent = {
-            "role": "user",
-            "trustScore": 40
-        }
-        
         agent_file = tmp_path / "agent.json"
-        policy_file = tmp_path / "policy.json"
-        content_file = tmp_path / "content.json"
+        policy_file = simple_files["policy"]
+        content_file = simple_files["content"]
         output_file = tmp_path / "output.json"
         
-        agent_file.write_text(json.dumps(low_trust_agent))
-        policy_file.write_text(json.dumps(SIMPLE_POLICY))
-        content_file.write_text(json.dumps(SIMPLE_CONTENT))
+        agent_file.write_bytes(_LOW_TRUST_AGENT_JSON)
         
         # Run redact
-        result = runner.invoke(app, [
-            "redact",
-            "-g", str(agent_file),
-            "-i", str(content_file),
-            "-p", str(policy_file),
-            "-o", str(output_file)
-        ])
+        exit_code, stdout = run_redact(content_file, policy_file, output_file, agent=agent_file)
         
-        if result.exit_code != 0:
-            print(f"\nRedaction failed with exit code: {result.exit_code}")
-            print(f"Output: {result.output}")
-            print(f"\nAgent data: {json.dumps(low_trust_agent, indent=2)}")
+        if exit_code != 0:
+            print(f"\nRedaction failed with exit code: {exit_code}")
+            print(f"Output: {stdout}")
+            print(f"\nAgent data: {json.dumps(LOW_TRUST_AGENT, indent=2)}")
             print(f"Policy data: {json.dumps(SIMPLE_POLICY, indent=2)}")
             print(f"Content data: {json.dumps(SIMPLE_CONTENT, indent=2)}")
         
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert output_file.exists()
         
         # Check output
@@ -127,7 +131,7 @@ class TestSimpleCLI:
         assert output["name"] == "John Doe"  # Not in mask list
         assert output["phone"] == "555-0123"  # Not in mask list
         
-    def test_no_root_pollution(self, tmp_path):
+    def test_no_root_pollution(self, tmp_path, simple_files):
         """Ensure no files are created in the project root."""
         project_root = Path.cwd()
         
@@ -135,47 +139,26 @@ class TestSimpleCLI:
         initial_files = set(project_root.glob("*"))
         
         # Run various CLI commands to ensure they don't pollute the root
-        agent_file = tmp_path / "agent.json"
-        policy_file = tmp_path / "policy.json"
-        content_file = tmp_path / "content.json"
+        agent_file = simple_files["agent"]
+        policy_file = simple_files["policy"]
+        content_file = simple_files["content"]
         output_file = tmp_path / "output.json"
         
         # Test 1: Simulate
-        agent_file.write_text(json.dumps(SIMPLE_AGENT))
-        policy_file.write_text(json.dumps(SIMPLE_POLICY))
-        
-        result = runner.invoke(app, [
-            "simulate",
-            "-a", str(agent_file),
-            "-p", str(policy_file)
-        ])
-        assert result.exit_code == 0, f"Simulate failed: {result.output}"
+        exit_code, stdout = run_simulate(agent_file, policy_file)
+        assert exit_code == 0, f"Simulate failed: {stdout}"
         
         # Test 2: Redact with admin
-        content_file.write_text(json.dumps(SIMPLE_CONTENT))
-        
-        result = runner.invoke(app, [
-            "redact",
-            "-g", str(agent_file),
-            "-i", str(content_file),
-            "-p", str(policy_file),
-            "-o", str(output_file)
-        ])
-        assert result.exit_code == 0, f"Redact failed: {result.output}"
+        exit_code, stdout = run_redact(content_file, policy_file, output_file, agent=agent_file)
+        assert exit_code == 0, f"Redact failed: {stdout}"
         
         # Test 3: Redact with low trust user
-        low_trust_agent = {"role": "user", "trustScore": 40}
-        agent_file.write_text(json.dumps(low_trust_agent))
+        agent_file = tmp_path / "low_trust_agent.json"
+        agent_file.write_bytes(_LOW_TRUST_AGENT_JSON)
         output_file2 = tmp_path / "output2.json"
         
-        result = runner.invoke(app, [
-            "redact",
-            "-g", str(agent_file),
-            "-i", str(content_file),
-            "-p", str(policy_file),
-            "-o", str(output_file2)
-        ])
-        assert result.exit_code == 0, f"Redact with low trust failed: {result.output}"
+        exit_code, stdout = run_redact(content_file, policy_file, output_file2, agent=agent_file)
+        assert exit_code == 0, f"Redact with low trust failed: {stdout}"
         
         # Check no new files in root
         final_files = set(project_root.glob("*"))
@@ -0,0 +1,161 @@
+"""
+Tests for the condition evaluator.
+"""
+
+import pytest
+from vault.engine.condition_evaluator import (
+    evaluate_condition,
+    clear_condition_cache,
+    condition_cache_info,
+    InvalidConditionError,
+)
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty condition cache."""
+    clear_condition_cache()
+    yield
+    clear_condition_cache()
+
+def test_simple_comparison():
+    """Test a numeric comparison against the context."""
+    result, explanation, fields = evaluate_condition("trustScore > 80", {"trustScore": 90})
+    assert result is True
+    assert explanation == "trustScore 90 > 80.0"
+    assert fields == ["trustScore"]
+
+def test_js_style_and():
+    """Test that && is normalized and both sides are evaluated."""
+    context = {"role": "admin", "trustScore": 50}
+    result, explanation, _ = evaluate_condition("role == 'admin' && trustScore >= 50", context)
+    assert result is True
+    assert "AND" in explanation
+
+def test_repeat_condition_is_parsed_once():
+    """Test that a repeated condition string hits the cache."""
+    for score in (10, 90, 50):
+        evaluate_condition("trustScore > 80", {"trustScore": score})
+    info = condition_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+def test_cached_condition_uses_new_context():
+    """Test that cached tokens are evaluated against each call's context."""
+    assert evaluate_condition("role == 'admin'", {"role": "admin"})[0] is True
+    assert evaluate_condition("role == 'admin'", {"role": "user"})[0] is False
+
+def test_invalid_condition_raises_every_time():
+    """Test that tokenizer errors are not cached."""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Unclosed string"):
+            evaluate_condition("role == 'admin", {"role": "admin"})
+    assert condition_cache_info().currsize == 0
+
+def test_empty_condition():
+    """Test that an empty condition is rejected before parsing."""
+    with pytest.raises(InvalidConditionError):
+        evaluate_condition("", {"role": "admin"})
+
+def test_missing_context_key():
+    """Test that a missing context key is reported."""
+    with pytest.raises(ValueError, match="Context key 'trustScore' not found"):
+        evaluate_condition("trustScore > 80", {"role": "admin"})
+
+def test_mixed_chain_groups_from_the_right():
+    """Test that a op b op c is evaluated as a op (b op c)."""
+    context = {"a": False, "b": False, "c": True}
+    result, explanation, _ = evaluate_condition("a && b || c", context)
+    # a && (b || c) is False; (a && b) || c would be True
+    assert result is False
+    assert explanation == (
+        "Context value 'a' is False AND Context value 'b' is False OR Context value 'c' is True"
+    )
+
+def test_long_chain_depth_limit():
+    """Test that chains up to the depth limit evaluate and longer ones fail."""
+    context = {f"field{i}": True for i in range(22)}
+    chain = " && ".join(f"field{i}" for i in range(21))
+    assert evaluate_condition(chain, context)[0] is True
+    with pytest.raises(ValueError, match="Maximum recursion depth of 20 exceeded"):
+        evaluate_condition(chain + " && field21", context)
+
+@pytest.mark.parametrize("condition, message", [
+    ("trustScore = 80", "Invalid operator at position 11"),
+    ("role == 'admin", "Unclosed string at position 8"),
+    ("trustScore > 8 # 0", "Unexpected character at position 15"),
+    ("trustScore > - 5", "Invalid number at position 13"),
+])
+def test_tokenizer_errors(condition, message):
+    """Test that tokenizer errors report the offending position."""
+    with pytest.raises(ValueError, match=message):
+        evaluate_condition(condition, {"trustScore": 90, "role": "admin"})
+
+def test_token_limit():
+    """Test that conditions over 100 tokens are rejected."""
+    context = {"trustScore": 90}
+    condition = " || ".join(["trustScore > 80"] * 26)  # 103 tokens
+    with pytest.raises(ValueError, match="maximum token limit of 100"):
+        evaluate_condition(condition, context)
+
+@pytest.mark.parametrize("score, message", [
+    (150, "must be between 0 and 100"),
+    ("85", "must be numeric"),
+    (None, "cannot be null"),
+])
+def test_trustscore_validated_in_comparisons(score, message):
+    """Test that context trustScore values are checked before ordering comparisons."""
+    with pytest.raises(ValueError, match=message):
+        evaluate_condition("trustScore > 50", {"trustScore": score})
+
+def test_trustscore_not_validated_when_unused():
+    """Test that an out-of-range trustScore only fails conditions that compare it."""
+    result, _, _ = evaluate_condition("role == 'admin'", {"role": "admin", "trustScore": 150})
+    assert result is True
+
+def test_token_limit_with_many_literals():
+    """Test that a condition with thousands of string literals is rejected."""
+    condition = " || ".join(["role == 'admin'"] * 10000)
+    with pytest.raises(ValueError, match="maximum token limit of 100"):
+        evaluate_condition(condition, {"role": "user"})
+
+def test_literal_contents_preserved():
+    """Test that operators inside string literals are not normalized."""
+    result, _, _ = evaluate_condition("comment == 'a && b || c'", {"comment": "a && b || c"})
+    assert result is True
+
+@pytest.mark.parametrize("condition, context, expected", [
+    ("role == 'admin'", {"role": "user"}, (False, "role 'user' != 'admin'")),
+    ("role != 'admin'", {"role": "user"}, (True, "role 'user' != 'admin'")),
+    ("trustScore >= 80", {"trustScore": 80}, (True, "trustScore 80 >= 80.0")),
+    ("trustScore < 80", {"trustScore": 80}, (False, "trustScore 80 < 80.0")),
+    ("trustScore <= 80", {"trustScore": 79}, (True, "trustScore 79 <= 80.0")),
+])
+def test_comparison_explanations(condition, context, expected):
+    """Test each comparison operator's result and explanation."""
+    result, explanation, _ = evaluate_condition(condition, context)
+    assert (result, explanation) == expected
+
+def test_repeat_evaluation_is_memoized():
+    """Test that repeating a condition and context skips parsing entirely."""
+    first = evaluate_condition("trustScore > 80", {"trustScore": 90})
+    second = evaluate_condition("trustScore > 80", {"trustScore": 90})
+    assert first == second
+    assert condition_cache_info().hits == 0
+
+def test_memoized_result_fields_are_fresh_lists():
+    """Test that callers can't alter a cached result's field list."""
+    _, _, fields = evaluate_condition("trustScore > 80", {"trustScore": 90})
+    fields.append("role")
+    assert evaluate_condition("trustScore > 80", {"trustScore": 90})[2] == ["trustScore"]
+
+def test_memoized_context_distinguishes_value_types():
+    """Test that True and 1, which hash alike, are not served from one entry."""
+    assert evaluate_condition("flag == 1", {"flag": 1})[1] == "flag 1 == 1.0"
+    assert evaluate_condition("flag == 1", {"flag": True})[1] == "flag True == 1.0"
+
+def test_unhashable_context_bypasses_memo():
+    """Test that contexts with unhashable values are still evaluated."""
+    context = {"role": "admin", "tags": ["a", "b"]}
+    assert evaluate_condition("role == 'admin'", context)[0] is True
+    assert evaluate_condition("role == 'admin'", context)[0] is True
+    assert condition_cache_info().hits == 1
@@ -0,0 +1,89 @@
+"""
+Tests for the diff command.
+"""
+
+import pytest
+import typer
+from typer.testing import CliRunner
+from vault.cli.main import app
+from vault.cli.diff import load_evaluation_result, compare_roles, compare_fields, compare_conditions
+from pathlib import Path
+import json
+
+runner = CliRunner()
+
+BEFORE = {
+    "roles": ["admin", "auditor"],
+    "fields_to_mask": ["ssn", "email"],
+    "conditions": [
+        {"condition": "trustScore > 80", "result": "pass"},
+        {"condition": "role == 'auditor'", "result": "fail"},
+        {"field": "email", "result": "pass"}
+    ]
+}
+
+AFTER = {
+    "roles": ["admin", "analyst"],
+    "fields_to_mask": ["ssn", "phone"],
+    "conditions": [
+        {"condition": "trustScore > 80", "result": "fail"},
+        {"condition": "role == 'auditor'", "result": "fail"},
+        {"condition": "role == 'analyst'", "result": "pass"}
+    ]
+}
+
+@pytest.fixture
+def result_files(tmp_path):
+    """Create before/after evaluation result files."""
+    before = tmp_path / "before.json"
+    after = tmp_path / "after.json"
+    before.write_text(json.dumps(BEFORE))
+    after.write_text(json.dumps(AFTER))
+    return before, after
+
+def test_compare_roles_and_fields():
+    """Test role and field set differences."""
+    assert compare_roles(BEFORE, AFTER) == ({"analyst"}, {"auditor"})
+    assert compare_fields(BEFORE, AFTER) == ({"phone"}, {"email"})
+
+def test_compare_conditions():
+    """Test condition changes, sorted by condition key."""
+    changes = compare_conditions(BEFORE, AFTER)
+    assert list(changes) == ["email", "role == 'analyst'", "trustScore > 80"]
+    assert changes["email"] == ("[red]removed[/red]", "was pass")
+    assert changes["role == 'analyst'"] == ("[green]added[/green]", "now pass")
+    assert changes["trustScore > 80"][1] == "evaluation flipped"
+
+def test_compare_conditions_verbose_includes_unchanged():
+    """Test that verbose mode keeps unchanged conditions."""
+    changes = compare_conditions(BEFORE, AFTER, verbose=True)
+    assert changes["role == 'auditor'"] == ("[yellow]unchanged[/yellow]", "still fail")
+
+def test_load_missing_fields(tmp_path):
+    """Test that results without required fields are rejected."""
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps({"roles": []}))
+    with pytest.raises(typer.BadParameter, match="missing fields"):
+        load_evaluation_result(path)
+
+def test_load_invalid_condition_result(tmp_path):
+    """Test that condition results other than pass/fail are rejected."""
+    path = tmp_path / "bad.json"
+    data = dict(BEFORE, conditions=[{"condition": "x", "result": "maybe"}])
+    path.write_text(json.dumps(data))
+    with pytest.raises(typer.BadParameter, match="must be 'pass' or 'fail'"):
+        load_evaluation_result(path)
+
+def test_diff_command(result_files):
+    """Test diff command summary output."""
+    before, after = result_files
+    result = runner.invoke(app, ["diff", "-b", str(before), "-a", str(after)])
+    assert result.exit_code == 0
+    assert "Found 7 change(s)" in result.stdout
+
+def test_diff_command_no_changes(result_files):
+    """Test diff of a result against itself."""
+    before, _ = result_files
+    result = runner.invoke(app, ["diff", "-b", str(before), "-a", str(before)])
+    assert result.exit_code == 0
+    assert "No changes found" in result.stdout
@@ -0,0 +1,49 @@
+"""
+Tests for the dry-run command.
+"""
+
+import pytest
+import vault.cli.dry_run as dry_run_module
+import json
+
+POLICY = {
+    "mask": ["ssn"],
+    "unmask_roles": ["admin"],
+    "conditions": ["trustScore > 80"]
+}
+
+@pytest.fixture
+def policy_file(tmp_path):
+    """Create a policy file whose condition fails for the default context."""
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps(POLICY))
+    return path
+
+def test_dry_run_quiet(policy_file, tmp_path, app, runner):
+    """Test that quiet mode reports the result and masked fields."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("name: John\nssn: 123-45-6789\n")
+    result = runner.invoke(app, ["dry-run", "-i", str(input_file), "-p", str(policy_file), "-q"])
+    assert result.exit_code == 0
+    assert result.stdout == "Result: All conditions failed\nFields to be masked: ssn\n"
+
+def test_invalid_policy_fails_before_reading_input(tmp_path, monkeypatch, app, runner):
+    """Test that a bad policy is reported without reading the input."""
+    def read_input(input_path):
+        raise AssertionError("input read before the policy was parsed")
+    monkeypatch.setattr(dry_run_module, "read_input", read_input)
+
+    policy_file = tmp_path / "policy.json"
+    policy_file.write_text("{not json")
+    result = runner.invoke(app, ["dry-run", "-p", str(policy_file), "-q"])
+    assert result.exit_code == 1
+    assert result.stdout.startswith("Error: ")
+    assert "input read" not in result.stdout
+
+def test_dry_run_stdin(policy_file, app, runner):
+    """Test that input is read from stdin when no input file is given."""
+    result = runner.invoke(app, ["dry-run", "-p", str(policy_file), "-q", "--preview"], input="ssn: 123-45-6789")
+    assert result.exit_code == 0
+    assert result.stdout == (
+        "Result: All conditions failed\nFields to be masked: ssn\n[MASKED ssn]: [MASKED]\n"
+    )
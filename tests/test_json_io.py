@@ -0,0 +1,43 @@
+"""
+Tests for JSON decoding with the optional orjson fast path.
+"""
+
+import json
+import math
+import pytest
+from vault.utils import json_io
+
+BIG = 123456789012345678901234567890
+
+@pytest.mark.parametrize("data", [
+    '{"input": %d}' % BIG,
+    b'{"input": %d}' % BIG,
+], ids=["str", "bytes"])
+def test_big_integers_stay_exact(data):
+    """Test that integers wider than 64 bits are not decoded as floats."""
+    assert json_io.loads(data) == {"input": BIG}
+    assert isinstance(json_io.loads(data)["input"], int)
+
+@pytest.mark.parametrize("value", [
+    2**64,
+    -(2**63) - 1,
+    -9999999999999999999,
+])
+def test_integers_just_outside_64_bits(value):
+    """Test the edges of the range orjson can decode as an integer."""
+    assert json_io.loads(str(value)) == value
+
+def test_nan_literal_falls_back():
+    """Test that NaN, which orjson rejects, still decodes."""
+    assert math.isnan(json_io.loads('{"score": NaN}')["score"])
+
+def test_matches_standard_library():
+    """Test that ordinary documents decode the same as json.loads."""
+    document = '{"role": "m\\u00e9decin", "trustScore": 80.5, "tags": [1, null, true]}'
+    assert json_io.loads(document) == json.loads(document)
+    assert json_io.loads(document.encode()) == json.loads(document)
+
+def test_invalid_json_raises():
+    """Test that invalid input raises the standard library's error."""
+    with pytest.raises(json.JSONDecodeError):
+        json_io.loads("{not json")
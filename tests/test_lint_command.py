@@ -3,27 +3,25 @@ Tests for the lint command.
 """
 
 import pytest
-from typer.testing import CliRunner
-from vault.cli.main import app
+from tests._fast_cli import run_lint
 from pathlib import Path
 import json
 
-runner = CliRunner()
-
-@pytest.fixture
-def temp_valid_policy_file(tmp_path):
+# Policy fixtures are module-scoped: the lint command only reads them
+@pytest.fixture(scope="module")
+def temp_valid_policy_file(tmp_path_factory):
     """Create a temporary policy file with no warnings."""
     policy_data = {
         "mask": ["ssn", "dob"],
         "unmask_roles": ["admin"],
         "conditions": ["trustScore > 85"]
     }
-    policy_file = tmp_path / "policy.json"
+    policy_file = tmp_path_factory.mktemp("lint") / "policy.json"
     policy_file.write_text(json.dumps(policy_data))
     return policy_file
 
-@pytest.fixture
-def temp_policy_with_warnings(tmp_path):
+@pytest.fixture(scope="module")
+def temp_policy_with_warnings(tmp_path_factory):
     """Create a temporary policy file with warnings."""
     policy_data = {
         "mask": ["ssn", "dob"],
@@ -33,41 +31,53 @@ def temp_policy_with_warnings(tmp_path):
             "trustScore > 75 || role == 'hr_admin'"  # Uses OR
         ]
     }
-    policy_file = tmp_path / "policy.json"
+    policy_file = tmp_path_factory.mktemp("lint") / "policy.json"
     policy_file.write_text(json.dumps(policy_data))
     return policy_file
 
 def test_valid_policy_no_warnings(temp_valid_policy_file):
     """Test lint command with a valid policy that has no warnings."""
-    result = runner.invoke(app, ["lint", "-p", str(temp_valid_policy_file)])
-    assert result.exit_code == 0
-    assert "Policy is valid!" in result.stdout
-    assert "Found 0 error(s) and 0 warning(s)" in result.stdout
+    exit_code, stdout = run_lint(temp_valid_policy_file)
+    assert exit_code == 0
+    assert "Policy is valid!" in stdout
+    assert "Found 0 error(s) and 0 warning(s)" in stdout
 
 def test_valid_policy_with_warnings(temp_policy_with_warnings):
     """Test lint command with a valid policy that has warnings."""
-    result = runner.invoke(app, ["lint", "-p", str(temp_policy_with_warnings)])
-    assert result.exit_code == 0
-    assert "Found 0 error(s)" in result.stdout
-    assert "warning(s)" in result.stdout
-    assert "Warning" in result.stdout
+    exit_code, stdout = run_lint(temp_policy_with_warnings)
+    assert exit_code == 0
+    assert "Found 0 error(s)" in stdout
+    assert "warning(s)" in stdout
+    assert "Warning" in stdout
 
 def test_valid_policy_strict_mode(temp_policy_with_warnings):
     """Test lint command with a valid policy that has warnings in strict mode."""
-    result = runner.invoke(app, ["lint", "-p", str(temp_policy_with_warnings), "--strict"])
-    assert result.exit_code == 1
-    assert "Found 0 error(s)" in result.stdout
-    assert "warning(s)" in result.stdout
-    assert "Warning" in result.stdout
+    exit_code, stdout = run_lint(temp_policy_with_warnings, strict=True)
+    assert exit_code == 1
+    assert "Found 0 error(s)" in stdout
+    assert "warning(s)" in stdout
+    assert "Warning" in stdout
 
-def test_malformed_policy():
-    """Test lint command with a malformed policy file."""
-    result = runner.invoke(app, ["lint", "-p", "examples/agents/malformed_policy.json"])
-    assert result.exit_code == 1
+@pytest.mark.parametrize("policy_path, exit_code", [
+    ("examples/agents/malformed_policy.json", 1),
+    ("does_not_exist.json", 2),  # Typer returns 2 for parameter validation errors
+], ids=["malformed", "nonexistent"])
+def test_lint_error_cases(app, runner, policy_path, exit_code):
+    """Test lint command with malformed and nonexistent policy files."""
+    result = runner.invoke(app, ["lint", "-p", policy_path], catch_exceptions=False)
+    assert result.exit_code == exit_code
     assert "Error" in result.stdout
 
-def test_nonexistent_policy():
-    """Test lint command with a nonexistent policy file."""
-    result = runner.invoke(app, ["lint", "-p", "does_not_exist.json"], catch_exceptions=False)
-    assert result.exit_code == 2  # Typer returns 2 for parameter validation errors
-    assert "Error" in result.stdout 
\ No newline at end of file
+def test_quiet_mode_prints_summary_only(temp_policy_with_warnings):
+    """Test that --quiet replaces the tables with one plain summary line."""
+    exit_code, stdout = run_lint(temp_policy_with_warnings, strict=True, quiet=True)
+    assert exit_code == 1
+    assert stdout == "Found 0 error(s) and 3 warning(s)\n"
+
+def test_quiet_mode_reports_errors(tmp_path):
+    """Test that --quiet reports unparseable policies as a plain error line."""
+    policy_file = tmp_path / "policy.json"
+    policy_file.write_text("{not json")
+    exit_code, stdout = run_lint(policy_file, quiet=True)
+    assert exit_code == 1
+    assert stdout.startswith("Error: ")
@@ -1,85 +1,85 @@
-#!/usr/bin/env python3
-"""Test malformed agent validation fix"""
+"""
+Test that the redact and simulate commands reject malformed agent files.
+"""
 
 import json
-import os
+import pytest
 
-print("Testing malformed agent validation...")
-print("=" * 60)
-
-# Create test data
-test_data = {"email": "test@example.com", "ssn": "123-45-6789"}
-with open("test_data.json", "w") as f:
-    json.dump(test_data, f)
-
-# Create policy
-policy = {
+POLICY = {
     "mask": ["email", "ssn"],
     "unmask_roles": ["admin"],
     "conditions": ["trustScore > 80"]
 }
-with open("test_policy.json", "w") as f:
-    json.dump(policy, f)
-
-# Test cases for malformed agents
-test_cases = [
-    ("Empty file", ""),
-    ("Invalid JSON", "{invalid json"),
-    ("Not an object", '"just a string"'),
-    ("Missing role", '{"trustScore": 80}'),
-    ("Empty role", '{"role": "", "trustScore": 80}'),
-    ("Non-string role", '{"role": 123, "trustScore": 80}'),
-    ("Invalid trustScore type", '{"role": "user", "trustScore": "high"}'),
-    ("TrustScore out of range", '{"role": "user", "trustScore": 150}'),
-    ("Negative trustScore", '{"role": "user", "trustScore": -10}'),
-    ("Null values", '{"role": null, "trustScore": null}'),
-]
 
-print("\nTesting REDACT command with malformed agents:")
-print("-" * 60)
+@pytest.fixture(scope="module")
+def inputs_dir(tmp_path_factory):
+    """Directory for the read-only inputs shared by every case."""
+    return tmp_path_factory.mktemp("malformed_agents")
 
-for name, content in test_cases:
-    print(f"\nTest: {name}")
-    print(f"Content: {content}")
-    
-    # Write malformed agent file
-    with open("malformed_agent.json", "w") as f:
-        f.write(content)
-    
-    # Test with redact command
-    result = os.system("vault redact -i test_data.json -p test_policy.json -g malformed_agent.json 2>&1")
-    if result != 0:
-        print("PASS: Command failed as expected (validation working)")
-    else:
-        print("FAIL: Command succeeded - validation NOT working!")
+@pytest.fixture(scope="module")
+def policy_file(inputs_dir):
+    """Policy masking the fields of the test data, written once per module."""
+    path = inputs_dir / "test_policy.json"
+    path.write_text(json.dumps(POLICY))
+    return path
 
-print("\n" + "=" * 60)
-print("Testing SIMULATE command with malformed agents:")
-print("-" * 60)
+@pytest.fixture(scope="module")
+def data_file(inputs_dir):
+    """Input data for the redact command, written once per module."""
+    path = inputs_dir / "test_data.json"
+    path.write_text(json.dumps({"email": "test@example.com", "ssn": "123-45-6789"}))
+    return path
 
-# Simulate requires trustScore, so test that specifically
-simulate_cases = [
-    ("Missing trustScore", '{"role": "user"}'),
-    ("Null trustScore", '{"role": "user", "trustScore": null}'),
-]
-
-for name, content in simulate_cases:
-    print(f"\nTest: {name}")
-    print(f"Content: {content}")
-    
-    with open("malformed_agent.json", "w") as f:
-        f.write(content)
-    
-    result = os.system("vault simulate --agent malformed_agent.json --policy test_policy.json 2>&1")
-    if result != 0:
-        print("PASS: Command failed as expected (validation working)")
-    else:
-        print("FAIL: Command succeeded - validation NOT working!")
+@pytest.fixture
+def agent_file(tmp_path):
+    """Path of the malformed agent file, written by each case."""
+    return tmp_path / "malformed_agent.json"
 
-# Cleanup
-for f in ["test_data.json", "test_policy.json", "malformed_agent.json"]:
-    if os.path.exists(f):
-        os.remove(f)
+@pytest.mark.parametrize("content", [
+    "",
+    "{invalid json",
+    '"just a string"',
+    '{"trustScore": 80}',
+    '{"role": "", "trustScore": 80}',
+    '{"role": 123, "trustScore": 80}',
+    '{"role": "user", "trustScore": "high"}',
+    '{"role": "user", "trustScore": 150}',
+    '{"role": "user", "trustScore": -10}',
+    '{"role": null, "trustScore": null}',
+], ids=[
+    "empty-file",
+    "invalid-json",
+    "not-an-object",
+    "missing-role",
+    "empty-role",
+    "non-string-role",
+    "invalid-trustscore-type",
+    "trustscore-out-of-range",
+    "negative-trustscore",
+    "null-values",
+])
+def test_redact_rejects_malformed_agent(content, agent_file, data_file, policy_file, app, runner):
+    """Test that redact fails instead of running with a malformed agent."""
+    agent_file.write_text(content)
+    result = runner.invoke(app, [
+        "redact",
+        "-i", str(data_file),
+        "-p", str(policy_file),
+        "-g", str(agent_file)
+    ])
+    assert result.exit_code == 1
 
-print("\n" + "=" * 60)
-print("Summary: Malformed agent files should now cause clear error messages")
\ No newline at end of file
+# Simulate requires trustScore, so test that specifically
+@pytest.mark.parametrize("content", [
+    '{"role": "user"}',
+    '{"role": "user", "trustScore": null}',
+], ids=["missing-trustscore", "null-trustscore"])
+def test_simulate_rejects_malformed_agent(content, agent_file, policy_file, app, runner):
+    """Test that simulate fails when the agent has no usable trustScore."""
+    agent_file.write_text(content)
+    result = runner.invoke(app, [
+        "simulate",
+        "--agent", str(agent_file),
+        "--policy", str(policy_file)
+    ])
+    assert result.exit_code == 1
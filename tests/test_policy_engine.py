@@ -0,0 +1,87 @@
+"""
+Tests for the policy engine.
+"""
+
+import json
+import os
+import pytest
+from vault.engine import policy_engine
+from vault.engine.policy_engine import evaluate, clear_policy_cache, policy_cache_info
+
+POLICY = {
+    "mask": ["ssn", "email"],
+    "unmask_roles": ["admin"],
+    "conditions": ["trustScore > 80"]
+}
+
+# Serialized once at import; tests that need their own file reuse it
+_POLICY_JSON = json.dumps(POLICY)
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty policy cache."""
+    clear_policy_cache()
+    yield
+    clear_policy_cache()
+
+@pytest.fixture(scope="module")
+def policy_path(tmp_path_factory):
+    """Policy file written once for the module; tests must not modify it."""
+    path = tmp_path_factory.mktemp("policy_engine") / "policy.json"
+    path.write_text(_POLICY_JSON)
+    return str(path)
+
+def test_evaluate_masks_when_conditions_fail(policy_path):
+    """Test that fields are masked when every condition fails."""
+    result = evaluate({"role": "user", "trustScore": 50}, policy_path)
+    assert result.success is False
+    assert result.reason == "All conditions failed"
+    assert result.fields == ["ssn", "email"]
+
+def test_evaluate_unmask_role(policy_path):
+    """Test that an unmask role skips condition evaluation."""
+    result = evaluate({"role": "admin", "trustScore": 10}, policy_path)
+    assert result.unmask_role_override is True
+    assert result.fields == []
+
+def test_repeat_evaluation_parses_policy_once(policy_path, monkeypatch):
+    """Test that an unchanged policy file is parsed only once."""
+    calls = []
+    parse_policy = policy_engine.parse_policy
+    monkeypatch.setattr(policy_engine, "parse_policy", lambda path: calls.append(path) or parse_policy(path))
+    for score in (10, 90, 50):
+        evaluate({"role": "user", "trustScore": score}, policy_path)
+    assert len(calls) == 1
+    info = policy_cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+def test_edited_policy_is_parsed_again(tmp_path):
+    """Test that changing the file on disk invalidates the cached policy."""
+    path = tmp_path / "policy.json"
+    path.write_text(_POLICY_JSON)
+    assert evaluate({"role": "user", "trustScore": 50}, str(path)).fields == ["ssn", "email"]
+
+    path.write_text(json.dumps({**POLICY, "mask": ["phone"]}))
+    stat = path.stat()
+    # Move the mtime forward in case the filesystem's clock is coarse
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert evaluate({"role": "user", "trustScore": 50}, str(path)).fields == ["phone"]
+
+def test_result_fields_do_not_alias_cached_policy(policy_path):
+    """Test that callers can't alter the cached policy through a result."""
+    evaluate({"role": "user", "trustScore": 50}, policy_path).fields.append("name")
+    assert evaluate({"role": "user", "trustScore": 50}, policy_path).fields == ["ssn", "email"]
+
+def test_invalid_policy_raises_every_time(tmp_path):
+    """Test that parse failures are not cached."""
+    path = tmp_path / "policy.json"
+    path.write_text("{not json")
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            evaluate({"role": "user"}, str(path))
+    assert policy_cache_info().currsize == 0
+
+def test_missing_policy_file(tmp_path):
+    """Test that a missing file is reported by the parser."""
+    with pytest.raises(FileNotFoundError):
+        evaluate({"role": "user"}, str(tmp_path / "missing.json"))
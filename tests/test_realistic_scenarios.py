@@ -1,4 +1,5 @@
 """Realistic scenario tests using production-quality test data."""
+import functools
 import json
 import pytest
 from pathlib import Path
@@ -14,8 +15,14 @@ TEST_DATA_DIR = Path(__file__).parent.parent / "dev" / "test-data"
 class TestRealisticScenarios:
     """Test realistic scenarios with production-quality data."""
     
-    def load_test_data(self, category: str, filename: str):
-        """Load test data from dev/test-data directory."""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def load_test_data(category: str, filename: str):
+        """Load test data from dev/test-data directory.
+        
+        Each file is parsed once per session and the same object is returned
+        to every caller, so tests must not modify it.
+        """
         filepath = TEST_DATA_DIR / category / filename
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -26,6 +26,12 @@ from tests.fixtures.realistic_test_data import (
 
 runner = CliRunner()
 
+# 300 patients for the performance test, serialized and encoded once at import
+_LARGE_HEALTHCARE_BYTES = json.dumps({
+    **HEALTHCARE_RECORDS,
+    "patients": HEALTHCARE_RECORDS["patients"] * 100,
+}).encode()
+
 class TestRedactWithHealthcareData:
     """Test redaction on realistic healthcare records."""
     
@@ -367,10 +373,6 @@ class TestRedactEdgeCasesAndSecurity:
     
     def test_large_healthcare_dataset(self, tmp_path):
         """Test performance with large healthcare dataset."""
-        # Create a larger dataset by duplicating patients
-        large_healthcare = HEALTHCARE_RECORDS.copy()
-        large_healthcare["patients"] = large_healthcare["patients"] * 100  # 300 patients
-        
         agent_file = tmp_path / "doctor.json"
         content_file = tmp_path / "large_patients.json"
         policy_file = tmp_path / "hipaa.json"
@@ -383,7 +385,7 @@ class TestRedactEdgeCasesAndSecurity:
         }
         
         agent_file.write_text(json.dumps(doctor_agent))
-        content_file.write_text(json.dumps(large_healthcare))
+        content_file.write_bytes(_LARGE_HEALTHCARE_BYTES)
         policy_file.write_text(json.dumps(HEALTHCARE_HIPAA_POLICY))
         
         import time
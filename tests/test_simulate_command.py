@@ -11,32 +11,33 @@ from vault.engine.condition_evaluator import normalize_condition
 
 runner = CliRunner()
 
-@pytest.fixture
-def temp_agent_file(tmp_path):
+# File fixtures are module-scoped: no test writes to them
+@pytest.fixture(scope="module")
+def temp_agent_file(tmp_path_factory):
     """Create a temporary agent file with admin role."""
     agent_data = {
         "role": "admin",
         "trustScore": 90,
         "department": "IT"
     }
-    agent_file = tmp_path / "agent.json"
+    agent_file = tmp_path_factory.mktemp("simulate") / "agent.json"
     agent_file.write_text(json.dumps(agent_data))
     return agent_file
 
-@pytest.fixture
-def temp_non_admin_agent_file(tmp_path):
+@pytest.fixture(scope="module")
+def temp_non_admin_agent_file(tmp_path_factory):
     """Create a temporary agent file with non-admin role."""
     agent_data = {
         "role": "analyst",
         "trustScore": 90,
         "department": "IT"
     }
-    agent_file = tmp_path / "agent.json"
+    agent_file = tmp_path_factory.mktemp("simulate") / "agent.json"
     agent_file.write_text(json.dumps(agent_data))
     return agent_file
 
-@pytest.fixture
-def temp_policy_file(tmp_path):
+@pytest.fixture(scope="module")
+def temp_policy_file(tmp_path_factory):
     """Create a temporary policy file."""
     policy_data = {
         "name": "Test Policy",
@@ -48,7 +49,7 @@ def temp_policy_file(tmp_path):
             "role == 'admin'"
         ]
     }
-    policy_file = tmp_path / "policy.json"
+    policy_file = tmp_path_factory.mktemp("simulate") / "policy.json"
     policy_file.write_text(json.dumps(policy_data))
     return policy_file
 
@@ -1,8 +1,22 @@
 import os
 import json
-from datetime import datetime
+import time
+import warnings
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry to one newline-terminated JSON line."""
+    # Always the standard library: the audit trail's bytes must not depend
+    # on which optional extras are installed, and orjson writes NaN as null,
+    # leaves non-ASCII unescaped and rejects integers wider than 64 bits
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+# Keys every agent passed to log_event must carry
+_REQUIRED_AGENT_KEYS = frozenset({"role", "trustScore"})
+
+# Size at which the active log is rotated to the next "<name>.N"
+ROTATE_AT_BYTES = 64 * 1024 * 1024
 
 def get_log_path() -> Path:
     """Get the path to the audit log file."""
@@ -10,14 +24,73 @@ def get_log_path() -> Path:
 
 def validate_agent(agent: Dict[str, Any]) -> None:
     """Validate the agent dictionary has required keys."""
-    required_keys = {"role", "trustScore"}
-    missing_keys = required_keys - set(agent.keys())
-    if missing_keys:
+    if not _REQUIRED_AGENT_KEYS <= agent.keys():
+        missing_keys = set(_REQUIRED_AGENT_KEYS - agent.keys())
         raise ValueError(f"Agent missing required keys: {missing_keys}")
 
+# Last whole second formatted by format_timestamp: (epoch_seconds, "YYYY-MM-DDTHH:MM:SS").
+# An immutable pair swapped in with one assignment, so a concurrent caller
+# always reads a second together with its own formatted text
+_second_cache = (None, "")
+
 def format_timestamp() -> str:
     """Get current timestamp in ISO 8601 format."""
-    return datetime.utcnow().isoformat() + "Z"
+    global _second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, text = _second_cache
+    if cached_seconds != seconds:
+        # Only reformat the date/time part when the second rolls over
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_cache = (seconds, text)
+    micros = nanos // 1000
+    # Match datetime.isoformat(), which omits a zero microsecond part
+    if micros:
+        return f"{text}.{micros:06d}Z"
+    return text + "Z"
+
+def last_generation(log_path: Path) -> int:
+    """Highest "<name>.N" generation next to the log, or 0 if there is none."""
+    prefix = log_path.name + "."
+    last = 0
+    with os.scandir(log_path.parent) as entries:
+        for entry in entries:
+            suffix = entry.name[len(prefix):]
+            if entry.name.startswith(prefix) and suffix.isdigit():
+                last = max(last, int(suffix))
+    return last
+
+def rotate_log(log_path: Path) -> Optional[Path]:
+    """
+    Move the active log to the next unused "<name>.N" generation.
+    
+    Generations are numbered from 1 upwards, so higher numbers are newer,
+    and a new one always goes above the highest that exists. The move is a
+    hard link followed by an unlink, and linking fails rather than replace
+    an existing name, so a rotated log is never overwritten. If another
+    writer rotated the log first, there is nothing left to move.
+    
+    Args:
+        log_path: Path of the active audit log
+        
+    Returns:
+        The path the log was moved to, or None if it was already gone
+        
+    Raises:
+        OSError: If the log could not be linked or unlinked
+    """
+    generation = last_generation(log_path) + 1
+    while True:
+        rotated = log_path.with_name(f"{log_path.name}.{generation}")
+        try:
+            os.link(log_path, rotated)
+        except FileExistsError:
+            # Another writer took this generation first
+            generation += 1
+            continue
+        except FileNotFoundError:
+            return None
+        os.unlink(log_path)
+        return rotated
 
 def log_event(action: str, field: str, agent: Dict[str, Any], result: str) -> None:
     """
@@ -52,10 +125,20 @@ def log_event(action: str, field: str, agent: Dict[str, Any], result: str) -> No
         # Ensure parent directory exists
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Append log entry
-        with log_path.open("a") as f:
-            json.dump(log_entry, f)
-            f.write("\n")
+        # Serialize before opening so a bad entry can't leave a partial
+        # line behind, then append it with a single write
+        line = _encode_entry(log_entry)
+        with log_path.open("ab") as f:
+            f.write(line)
+            size = f.tell()
             
     except Exception as e:
-        raise IOError(f"Failed to write to audit log: {str(e)}") 
\ No newline at end of file
+        raise IOError(f"Failed to write to audit log: {str(e)}")
+    
+    # Rotate only once the event is safely written, and don't report a
+    # failed rotation as a failed write: the event is already in the log
+    if size >= ROTATE_AT_BYTES:
+        try:
+            rotate_log(log_path)
+        except OSError as e:
+            warnings.warn(f"Failed to rotate audit log {log_path}: {e}")
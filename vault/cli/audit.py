@@ -4,9 +4,13 @@ Audit log viewer command.
 
 import json
 import csv
+import operator
+import os
+import stat
 import sys
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Union, TextIO
+from typing import List, Dict, Any, Optional, Set, Tuple, Union, BinaryIO, TextIO, Iterable, Iterator, Generator
 from datetime import datetime
 from collections import defaultdict
 import typer
@@ -15,11 +19,17 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+from ..audit.audit_logger import last_generation
+from ..utils import json_io
+
 app = typer.Typer()
 console = Console()
 
 # Required fields in audit log entries
-REQUIRED_FIELDS = {"timestamp", "action", "role", "field"}
+REQUIRED_FIELDS = frozenset({"timestamp", "action", "role", "field"})
+
+# Column order for CSV export
+CSV_FIELDS = ("timestamp", "action", "role", "field", "input", "output")
 
 def validate_timestamp(timestamp: str) -> bool:
     """Validate timestamp format."""
@@ -29,47 +39,145 @@ def validate_timestamp(timestamp: str) -> bool:
     except ValueError:
         return False
 
-def read_audit_log(log_path: Path) -> List[Dict[str, Any]]:
-    """Read and validate audit log entries from a JSONL or JSON file."""
-    entries = []
+# Where a reader stopped in the active log: (inode, byte offset). The inode
+# tells a resumed read whether the log was rotated in the meantime
+LogPosition = Tuple[int, int]
+
+def _resume_offset(f: BinaryIO, size: int, since_offset: int) -> int:
+    """Where to resume reading a JSONL log, or 0 if it was rewritten since.
+    
+    An offset taken before the file was truncated or rewritten in place is
+    past the end of it, or lands mid-line rather than just after a newline.
+    """
+    if since_offset > size:
+        return 0
+    f.seek(since_offset - 1)
+    if f.read(1) != b"\n":
+        return 0
+    return since_offset
+
+def _open_rotated(log_path: Path, since: LogPosition) -> Optional[BinaryIO]:
+    """Open the newest rotated generation at ``since`` if it is the file read last.
+    
+    Returns None when there is no rotated generation, or when the newest one
+    is not the file ``since`` was taken from.
+    """
+    generation = last_generation(log_path)
+    if not generation:
+        return None
+    try:
+        f = open(log_path.with_name(f"{log_path.name}.{generation}"), "rb")
+    except OSError:
+        return None
+    st = os.fstat(f.fileno())
+    inode, offset = since
+    if st.st_ino != inode or offset > st.st_size:
+        f.close()
+        return None
+    f.seek(offset)
+    return f
+
+def _unread_lines(rotated: Optional[BinaryIO], f: BinaryIO, offset: int) -> Iterator[Tuple[bytes, int]]:
+    """Yield each unread raw line with the position in ``f`` just after it.
+    
+    The rest of a rotated generation comes first, then ``f`` from ``offset``.
+    The position only moves past newline-terminated lines, so a line still
+    being written is read again once it is complete.
+    """
+    if rotated is not None:
+        with rotated:
+            for line in rotated:
+                yield line, offset
+    f.seek(offset)
+    for line in f:
+        if line.endswith(b"\n"):
+            offset += len(line)
+        yield line, offset
+
+def iter_audit_log(log_path: Path, since: Optional[LogPosition] = None) -> Generator[Dict[str, Any], None, Optional[LogPosition]]:
+    """Lazily yield validated audit log entries from a JSONL or JSON file.
+    
+    JSONL files are read one line at a time, so only the current entry is
+    held in memory. Warnings for malformed lines are printed as they are hit.
+    
+    ``since`` is the position a previous read of a JSONL log returned, so a
+    tailing reader only parses newly appended entries. If the log was
+    rotated since, the unread end of the newest rotated generation is read
+    before the new log. If the position no longer fits either file, the log
+    is read from the start. It is ignored for JSON files.
+    
+    Returns:
+        The position after the last complete line read, for the next call's
+        ``since``, or None for JSON files
+    """
     malformed_lines = 0
     
-    if not log_path.exists():
+    # Open first and let the OS report a missing path, instead of paying for
+    # separate exists()/is_file()/stat() lookups before the open
+    try:
+        f = open(log_path, "rb")
+    except FileNotFoundError:
         raise typer.BadParameter(f"Audit log file not found: {log_path}")
-        
-    if not log_path.is_file():
+    except IsADirectoryError:
         raise typer.BadParameter(f"Path is not a file: {log_path}")
         
-    if not log_path.stat().st_size:
+    st = os.fstat(f.fileno())
+    is_json = log_path.suffix == ".json"
+    offset = 0
+    rotated = None
+    if since is not None and not is_json:
+        if since[0] == st.st_ino:
+            offset = _resume_offset(f, st.st_size, since[1]) if since[1] else 0
+            if offset != since[1]:
+                console.print(f"[yellow]Warning: Audit log changed since offset {since[1]}, reading from the start[/yellow]")
+        else:
+            rotated = _open_rotated(log_path, since)
+            if rotated is None:
+                console.print("[yellow]Warning: Audit log replaced since the last read, reading it from the start[/yellow]")
+    position = None if is_json else (st.st_ino, offset)
+    
+    if not st.st_size and rotated is None:
+        f.close()
         console.print(Panel(
             "[yellow]No entries found in audit log[/yellow]",
             title="Warning",
             border_style="yellow"
         ))
-        return entries
+        return position
         
     try:
-        with open(log_path, "r") as f:
+        with f:
             # Handle both JSONL and JSON formats
-            if log_path.suffix == ".json":
+            if is_json:
                 try:
-                    data = json.load(f)
+                    data = json_io.loads(f.read())
                     if isinstance(data, dict) and "detailed_log" in data:
                         lines = data["detailed_log"]
                     else:
                         lines = [data]
                 except json.JSONDecodeError:
                     raise typer.BadParameter("Invalid JSON file format")
+                lines = ((entry, None) for entry in lines)
             else:
-                lines = f.readlines()
+                # Raw bytes lines straight from the read buffer; both decoders
+                # accept UTF-8 bytes, so there is no separate decode step
+                lines = _unread_lines(rotated, f, offset)
 
-            for line_num, line in enumerate(lines, 1):
-                if isinstance(line, str):
+            for line_num, (line, end) in enumerate(lines, 1):
+                if end is not None:
+                    position = (st.st_ino, end)
+                if isinstance(line, bytes):
                     line = line.strip()
                     if not line:  # Skip empty lines
                         continue
+                    # Entries are JSON objects; reject anything else with a
+                    # cheap bytes check instead of a raised decode error
+                    if not (line.startswith(b"{") and line.endswith(b"}")):
+                        console.print(f"[yellow]Warning: Invalid JSON in line {line_num}[/yellow]")
+                        malformed_lines += 1
+                        continue
                     try:
-                        entry = json.loads(line)
+                        entry = json_io.loads(line)
                     except json.JSONDecodeError:
                         console.print(f"[yellow]Warning: Invalid JSON in line {line_num}[/yellow]")
                         malformed_lines += 1
@@ -78,8 +186,8 @@ def read_audit_log(log_path: Path) -> List[Dict[str, Any]]:
                     entry = line
 
                 # Validate required fields
-                missing_fields = REQUIRED_FIELDS - set(entry.keys())
-                if missing_fields:
+                if not REQUIRED_FIELDS <= entry.keys():
+                    missing_fields = set(REQUIRED_FIELDS - entry.keys())
                     console.print(f"[yellow]Warning: Missing required fields {missing_fields} in line {line_num}[/yellow]")
                     malformed_lines += 1
                     continue
@@ -90,7 +198,7 @@ def read_audit_log(log_path: Path) -> List[Dict[str, Any]]:
                     malformed_lines += 1
                     continue
                     
-                entries.append(entry)
+                yield entry
                     
     except Exception as e:
         raise typer.BadParameter(f"Error reading audit log: {str(e)}")
@@ -101,8 +209,37 @@ def read_audit_log(log_path: Path) -> List[Dict[str, Any]]:
             title="Warning",
             border_style="yellow"
         ))
+    return position
+
+def read_audit_log(log_path: Path) -> List[Dict[str, Any]]:
+    """Read and validate audit log entries from a JSONL or JSON file."""
+    return list(iter_audit_log(log_path))
+
+def tail_audit_log(log_path: Path, since: Optional[LogPosition] = None) -> Tuple[List[Dict[str, Any]], Optional[LogPosition]]:
+    """
+    Read the entries appended to an audit log since a previous read.
+    
+    Args:
+        log_path: Path of the active audit log
+        since: Position returned by the previous call, or None to read it all
         
-    return entries
+    Returns:
+        The new entries, and the position to pass as ``since`` next time
+    """
+    entries = []
+    reader = iter_audit_log(log_path, since)
+    while True:
+        try:
+            entries.append(next(reader))
+        except StopIteration as done:
+            return entries, done.value
+
+def filter_by_role(entries: Iterable[Dict[str, Any]], role: str) -> Iterator[Dict[str, Any]]:
+    """Yield entries whose role contains ``role`` (case-insensitive)."""
+    # Lower-case the filter once rather than once per entry
+    needle = role.lower()
+    get_role = operator.itemgetter("role")
+    return (e for e in entries if needle in get_role(e).lower())
 
 def get_summary_stats(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate summary statistics from audit log entries."""
@@ -115,14 +252,25 @@ def get_summary_stats(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
             "timestamp_range": (None, None)
         }
 
-    timestamps = [datetime.fromisoformat(e["timestamp"].replace("Z", "+00:00")) for e in entries]
+    # One pass over the entries instead of one per statistic
+    roles, actions, fields = set(), set(), set()
+    first = last = None
+    for e in entries:
+        roles.add(e["role"])
+        actions.add(e["action"])
+        fields.add(e["field"])
+        timestamp = datetime.fromisoformat(e["timestamp"].replace("Z", "+00:00"))
+        if first is None or timestamp < first:
+            first = timestamp
+        if last is None or timestamp > last:
+            last = timestamp
     
     return {
         "total_entries": len(entries),
-        "unique_roles": {e["role"] for e in entries},
-        "unique_actions": {e["action"] for e in entries},
-        "unique_fields": {e["field"] for e in entries},
-        "timestamp_range": (min(timestamps), max(timestamps))
+        "unique_roles": roles,
+        "unique_actions": actions,
+        "unique_fields": fields,
+        "timestamp_range": (first, last)
     }
 
 def format_summary_panel(stats: Dict[str, Any]) -> Panel:
@@ -222,52 +370,106 @@ def format_full_table(entries: List[Dict[str, Any]]) -> Table:
     table.add_column("Input", style="white")
     table.add_column("Output", style="white")
     
-    # Add rows
+    # Cells are plain Text: log values are data, not Rich markup, so this
+    # skips markup parsing at render time (and keeps "[...]" values intact)
     for entry in entries:
         table.add_row(
-            entry["timestamp"],
-            entry["role"],
-            entry["action"],
-            entry["field"],
-            str(entry.get("input", "")),
-            str(entry.get("output", ""))
+            Text(entry["timestamp"]),
+            Text(entry["role"]),
+            Text(entry["action"]),
+            Text(entry["field"]),
+            Text(str(entry.get("input", ""))),
+            Text(str(entry.get("output", "")))
         )
     
     return table
 
-def export_csv(entries: List[Dict[str, Any]], output: Union[str, Path, TextIO]) -> None:
-    """Export entries to CSV format."""
-    fieldnames = ["timestamp", "action", "role", "field", "input", "output"]
+def _csv_row(entry: Dict[str, Any]) -> tuple:
+    """Project an entry onto the fixed CSV column order, blank where missing."""
+    return tuple(entry.get(field, "") for field in CSV_FIELDS)
+
+def _write_csv(stream: TextIO, entries: Iterable[Dict[str, Any]]) -> None:
+    """Write the CSV header and one row per entry to an open stream.
     
+    The first entry is pulled before anything is written, so a log that
+    can't be opened or fails on its first line leaves the stream untouched.
+    """
+    rows = map(_csv_row, entries)
+    first = next(rows, None)
+    # csv.writer (not a plain f-string join) because input/output are free
+    # text and may contain commas, quotes or newlines that need escaping
+    writer = csv.writer(stream)
+    writer.writerow(CSV_FIELDS)
+    if first is not None:
+        writer.writerow(first)
+        writer.writerows(rows)
+
+def _default_file_mode() -> int:
+    """Permissions open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def _write_csv_file(path: Path, entries: Iterable[Dict[str, Any]]) -> None:
+    """Write the CSV to ``path``, replacing a regular file only once complete.
+    
+    Regular files are written to a temp file next to the symlink-resolved
+    target and moved over it when done. Devices and FIFOs such as
+    /dev/stdout can't be replaced, so they are written in place.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        mode = None
+    if mode is not None and not stat.S_ISREG(mode):
+        with open(path, "w", newline="") as f:
+            _write_csv(f, entries)
+        return
+        
+    target = Path(os.path.realpath(path))
+    f = tempfile.NamedTemporaryFile(
+        "w", newline="", dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            _write_csv(f, entries)
+        # NamedTemporaryFile is private (0600); keep the mode the export had
+        os.chmod(f.name, stat.S_IMODE(mode) if mode is not None else _default_file_mode())
+        os.replace(f.name, target)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+def export_csv(entries: Iterable[Dict[str, Any]], output: Union[str, Path, TextIO]) -> None:
+    """Export entries to CSV format.
+    
+    Rows are written as they are pulled from ``entries``, so a generator such
+    as ``iter_audit_log`` can be exported without building a list first.
+    Nothing is written if the first entry can't be read. If reading fails
+    later, a regular export file keeps its previous contents, while stdout
+    and other streams already have the rows written so far.
+    """
     if isinstance(output, (str, Path)):
         if str(output) == "-":
-            writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
-            writer.writeheader()
-            for entry in entries:
-                writer.writerow({k: entry.get(k, "") for k in fieldnames})
+            _write_csv(sys.stdout, entries)
         else:
-            with open(output, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for entry in entries:
-                    writer.writerow({k: entry.get(k, "") for k in fieldnames})
+            _write_csv_file(Path(output), entries)
     else:
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for entry in entries:
-            writer.writerow({k: entry.get(k, "") for k in fieldnames})
+        _write_csv(output, entries)
 
 def export_json(entries: List[Dict[str, Any]], output: Union[str, Path, TextIO]) -> None:
     """Export entries to JSON format."""
+    # The standard library on purpose: orjson writes non-ASCII unescaped and
+    # NaN as null, so the export would depend on whether the extra is installed
+    content = json.dumps(entries, indent=2)
     if isinstance(output, (str, Path)):
         if str(output) == "-":
-            json.dump(entries, sys.stdout, indent=2)
-            sys.stdout.write("\n")
+            sys.stdout.write(content + "\n")
         else:
             with open(output, "w") as f:
-                json.dump(entries, f, indent=2)
+                f.write(content)
     else:
-        json.dump(entries, output, indent=2)
+        output.write(content)
 
 @app.command()
 def audit(
@@ -312,18 +514,21 @@ def audit(
     Can export to CSV or JSON format.
     """
     try:
+        # CSV export streams straight from the log without materializing it
+        if export:
+            entries = iter_audit_log(log)
+            if role:
+                entries = filter_by_role(entries, role)
+            export_csv(entries, export)
+            return
+        
         # Read and validate audit log
         entries = read_audit_log(log)
         
         # Filter by role if specified
         if role:
-            entries = [e for e in entries if role.lower() in e["role"].lower()]
+            entries = list(filter_by_role(entries, role))
         
-        # Export if requested
-        if export:
-            export_csv(entries, export)
-            return
-            
         if json_out:
             export_json(entries, json_out)
             return
@@ -1,19 +1,23 @@
 import json
 from pathlib import Path
-from typing import Dict, Any, Set, List, Tuple, Optional
+from typing import Dict, Any, Set, Tuple, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
 
+from ..utils import json_io
+
 app = typer.Typer()
 console = Console()
 
+REQUIRED_FIELDS = frozenset({"roles", "fields_to_mask", "conditions"})
+CONDITION_RESULTS = frozenset({"pass", "fail"})
+
 def validate_evaluation_result(data: Dict[str, Any]) -> None:
     """Validate the structure of an evaluation result."""
-    required_fields = {"roles", "fields_to_mask", "conditions"}
-    missing_fields = required_fields - set(data.keys())
+    missing_fields = REQUIRED_FIELDS - data.keys()
     if missing_fields:
         raise typer.BadParameter(f"Invalid evaluation result: missing fields {missing_fields}")
     
@@ -30,7 +34,7 @@ def validate_evaluation_result(data: Dict[str, Any]) -> None:
             raise typer.BadParameter(f"Invalid evaluation result: condition {i} must be a dictionary")
         if "result" not in condition:
             raise typer.BadParameter(f"Invalid evaluation result: condition {i} missing 'result'")
-        if condition["result"] not in ["pass", "fail"]:
+        if condition["result"] not in CONDITION_RESULTS:
             raise typer.BadParameter(f"Invalid evaluation result: condition {i} result must be 'pass' or 'fail'")
         # Allow either field or condition string
         if "field" not in condition and "condition" not in condition:
@@ -39,7 +43,7 @@ def validate_evaluation_result(data: Dict[str, Any]) -> None:
 def load_evaluation_result(file_path: Path) -> Dict[str, Any]:
     """Load a policy evaluation result from JSON file."""
     try:
-        data = json.loads(file_path.read_text())
+        data = json_io.loads(file_path.read_bytes())
         validate_evaluation_result(data)
         return data
     except json.JSONDecodeError as e:
@@ -81,9 +85,14 @@ def format_condition_change(before_result: Optional[str], after_result: Optional
             "evaluation flipped"
         )
 
-def compare_conditions(before: Dict[str, Any], after: Dict[str, Any], verbose: bool = False) -> List[Tuple[str, str, str]]:
-    """Compare condition evaluations between two results."""
-    changes = []
+def compare_conditions(before: Dict[str, Any], after: Dict[str, Any], verbose: bool = False) -> Dict[str, Tuple[str, str]]:
+    """
+    Compare condition evaluations between two results.
+    
+    Returns a mapping of condition key to (change, details), ordered by
+    condition key.
+    """
+    changes = {}
     
     # Skip comparison if either file has no conditions
     if not before.get("conditions") and not after.get("conditions"):
@@ -100,7 +109,7 @@ def compare_conditions(before: Dict[str, Any], after: Dict[str, Any], verbose: b
     }
     
     # Check all conditions that appear in either result
-    all_conditions = set(before_conditions.keys()) | set(after_conditions.keys())
+    all_conditions = before_conditions.keys() | after_conditions.keys()
     
     for condition in sorted(all_conditions):
         before_result = before_conditions.get(condition)
@@ -110,8 +119,7 @@ def compare_conditions(before: Dict[str, Any], after: Dict[str, Any], verbose: b
         if before_result == after_result and not verbose:
             continue
             
-        change, details = format_condition_change(before_result, after_result)
-        changes.append((condition, change, details))
+        changes[condition] = format_condition_change(before_result, after_result)
     
     return changes
 
@@ -120,7 +128,7 @@ def format_diff(
     removed_roles: Set[str],
     added_fields: Set[str],
     removed_fields: Set[str],
-    condition_changes: List[Tuple[str, str, str]],
+    condition_changes: Dict[str, Tuple[str, str]],
     verbose: bool = False
 ) -> None:
     """Format and display the diff results."""
@@ -159,7 +167,7 @@ def format_diff(
         condition_table.add_column("Change", style="bold")
         condition_table.add_column("Details", style="white")
         
-        for condition, change, details in condition_changes:
+        for condition, (change, details) in condition_changes.items():
             condition_table.add_row(condition, change, details)
         
         console.print(condition_table)
@@ -169,7 +177,7 @@ def format_diff(
     total_changes = (
         len(added_roles) + len(removed_roles) +
         len(added_fields) + len(removed_fields) +
-        len([c for c in condition_changes if "unchanged" not in c[1]])
+        sum(1 for change, _ in condition_changes.values() if "unchanged" not in change)
     )
     
     if total_changes == 0:
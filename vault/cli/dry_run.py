@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.syntax import Syntax
 
-from vault.engine.policy_parser import load_policy
+from vault.engine.policy_parser import parse_policy
 from vault.engine.policy_engine import evaluate
 
 app = typer.Typer()
@@ -106,6 +106,12 @@ def dry_run(
         "--preview",
         help="Show preview of masked output",
     ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Print plain results without the input listing or formatting",
+    ),
 ) -> None:
     """
     Perform a dry run of policy evaluation on input text.
@@ -113,6 +119,9 @@ def dry_run(
     Shows which fields would be masked without actually modifying the input.
     """
     try:
+        # Parse the policy first so a bad policy fails before input is read
+        policy_data = parse_policy(policy)
+        
         # Read input
         input_text, is_file = read_input(input)
         
@@ -124,10 +133,17 @@ def dry_run(
         }
         
         # Evaluate policy
-        result = evaluate(context, str(policy))
+        result = evaluate(context, policy_data)
         fields_to_mask = set(result.fields) if not result.success else set()
         
         # Output results
+        if quiet:
+            masked = ", ".join(sorted(fields_to_mask)) or "none"
+            sys.stdout.write(f"Result: {result.reason}\nFields to be masked: {masked}\n")
+            if preview:
+                sys.stdout.write(format_masked_preview(input_text, fields_to_mask) + "\n")
+            return
+        
         console.print("\n[bold]Policy Evaluation:[/bold]")
         console.print(Panel(
             f"[{'green' if result.success else 'red'}]{result.reason}[/{'green' if result.success else 'red'}]",
@@ -149,6 +165,9 @@ def dry_run(
             ))
         
     except Exception as e:
+        if quiet:
+            sys.stdout.write(f"Error: {e}\n")
+            raise typer.Exit(1)
         console.print(Panel(
             f"[red]Error:[/red] {str(e)}",
             title="[red]Error[/red]",
@@ -3,6 +3,7 @@ Lint command for validating policy files.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import List, Dict, Any, Set, Tuple
 import typer
@@ -141,6 +142,12 @@ def lint(
         False,
         "--strict",
         help="Treat warnings as fatal errors (exit code 1)"
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Print only a plain summary line instead of tables"
     )
 ) -> None:
     """
@@ -170,7 +177,10 @@ def lint(
         warnings.extend(check_missing_context_fields(policy_data))
         
         # Display results
-        format_validation_results(errors, warnings)
+        if quiet:
+            sys.stdout.write(f"Found {len(errors)} error(s) and {len(warnings)} warning(s)\n")
+        else:
+            format_validation_results(errors, warnings)
         
         # Exit with appropriate code
         if errors:
@@ -181,6 +191,9 @@ def lint(
             raise typer.Exit(0)
             
     except (FileNotFoundError, ValueError) as e:
+        if quiet:
+            sys.stdout.write(f"Error: {e}\n")
+            raise typer.Exit(1)
         console.print(Panel(
             f"[red]Error:[/red] {str(e)}",
             title="[red]Error[/red]",
@@ -13,6 +13,7 @@ from rich.table import Table
 from rich.panel import Panel
 from ..sdk.redact import redact as sdk_redact
 from ..sdk.redact import validate_policy, RedactionResult
+from ..utils import json_io
 from datetime import datetime, timezone
 app = typer.Typer()
 console = Console()
@@ -227,7 +228,7 @@ def redact(
     try:
         # Read and parse policy
         try:
-            policy_content = json.loads(policy.read_text())
+            policy_content = json_io.loads(policy.read_bytes())
         except json.JSONDecodeError:
             console.print("[red]Error: Policy file must be valid JSON[/red]")
             sys.exit(1)
@@ -259,7 +260,7 @@ def redact(
                 
                 # Parse JSON
                 try:
-                    agent_context = json.loads(agent_content)
+                    agent_context = json_io.loads(agent_content)
                 except json.JSONDecodeError as e:
                     console.print(f"[red]Error: Invalid JSON in agent file: {sanitize_error_message(e)}[/red]")
                     sys.exit(1)
@@ -12,12 +12,21 @@ from rich.panel import Panel
 from rich.text import Text
 from datetime import datetime
 from ..engine.policy_engine import evaluate
+from ..utils import json_io
 
 app = typer.Typer()
 console = Console()
 
 def load_agent_context(agent_path: Path) -> dict:
     """Load agent context from JSON file with comprehensive security validation."""
+    try:
+        content = agent_path.read_text()
+    except OSError:
+        raise ValueError("Failed to load agent file")
+    return load_agent_context_from_text(content)
+
+def load_agent_context_from_text(content: str) -> dict:
+    """Load agent context from JSON text with the same validation as a file."""
     try:
         # Import security validators
         from ..utils.security_validators import (
@@ -27,8 +36,7 @@ def load_agent_context(agent_path: Path) -> dict:
             SecurityValidationError
         )
         
-        # Read and validate size
-        content = agent_path.read_text()
+        # Validate size
         validate_content_size(content)
         
         if not content.strip():
@@ -36,7 +44,7 @@ def load_agent_context(agent_path: Path) -> dict:
         
         # Parse JSON
         try:
-            context = json.loads(content)
+            context = json_io.loads(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in agent file: {str(e)}")
         
@@ -170,7 +178,7 @@ def format_export_data(context: Dict[str, Any], result, policy_path: Optional[Pa
     # Add policy metadata if available
     if policy_path:
         try:
-            policy_data = json.loads(policy_path.read_text())
+            policy_data = json_io.loads(policy_path.read_bytes())
             export_data["policy_name"] = policy_data.get("name")
             export_data["template_id"] = policy_data.get("template_id")
         except (json.JSONDecodeError, IOError):
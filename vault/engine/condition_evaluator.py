@@ -2,10 +2,22 @@
 Condition evaluator for policy engine.
 """
 
-from typing import Dict, Tuple, Any, List, Optional, Union, Set
+from typing import Dict, Tuple, Any, List, NamedTuple, Optional, Union, Set
+import functools
+import operator
 import re
+import sys
 from enum import Enum, auto
 
+# Distinct condition strings whose token lists are kept
+_CONDITION_CACHE_SIZE = 1024
+
+# Distinct (condition, context) pairs whose results are kept
+_RESULT_CACHE_SIZE = 2048
+
+# Sentinel for context lookups, since None is a valid context value
+_MISSING = object()
+
 class ConditionValidationError(ValueError):
     """Custom exception for condition validation errors."""
     pass
@@ -39,11 +51,36 @@ class TokenType(Enum):
     LITERAL = auto()
     PAREN = auto()
 
-class Token:
-    """Represents a token in the condition string."""
-    def __init__(self, type: TokenType, value: Any):
-        self.type = type
-        self.value = value
+class Token(NamedTuple):
+    """Represents a token in the condition string.
+    
+    Immutable, since parsed token tuples are shared through the condition
+    cache.
+    """
+    type: TokenType
+    value: Any
+
+# Operators that need numeric operands
+_ORDERING_OPERATORS = frozenset({
+    Operator.GREATER_THAN,
+    Operator.LESS_THAN,
+    Operator.GREATER_THAN_OR_EQUAL,
+    Operator.LESS_THAN_OR_EQUAL,
+})
+
+# Comparison function and display symbol for each comparison operator
+_COMPARISONS = {
+    Operator.EQUALS: (operator.eq, "=="),
+    Operator.NOT_EQUALS: (operator.ne, "!="),
+    Operator.GREATER_THAN: (operator.gt, ">"),
+    Operator.LESS_THAN: (operator.lt, "<"),
+    Operator.GREATER_THAN_OR_EQUAL: (operator.ge, ">="),
+    Operator.LESS_THAN_OR_EQUAL: (operator.le, "<="),
+}
+
+def _is_number_literal(token: Token) -> bool:
+    """Whether a token is a number written in the condition itself."""
+    return token.type == TokenType.VALUE and isinstance(token.value, float)
 
 def _validate_numeric(value: Any, field_name: str) -> float:
     """
@@ -79,6 +116,9 @@ def _validate_numeric(value: Any, field_name: str) -> float:
         
     return num_value
 
+# Placeholders normalize_condition substitutes for string literals
+_LITERAL_KEY_RE = re.compile(r"__STR_LIT_\d+__")
+
 def normalize_condition(condition: str) -> str:
     """
     Normalize JavaScript-style condition syntax to Python-style.
@@ -116,12 +156,55 @@ def normalize_condition(condition: str) -> str:
     condition = re.sub(r'\s+', ' ', condition)
     condition = condition.strip()
     
-    # Restore string literals
-    for key, value in literals.items():
-        condition = condition.replace(key, value)
+    # Restore string literals in one pass; replacing them key by key
+    # rescans the whole condition once per literal
+    if literals:
+        condition = _LITERAL_KEY_RE.sub(
+            lambda match: literals.get(match.group(), match.group()), condition
+        )
         
     return condition
 
+# One token per match, with any whitespace before it. Alternatives are tried
+# in order, so word operators are split off the front of a name as they
+# always have been; ERROR catches any character no token can start with.
+_TOKEN_RE = re.compile(r"""\s*(?:
+    (?P<OPERATOR>and|or|not|>=|<=|==|!=|>|<)
+  | (?P<IDENT>[a-zA-Z][a-zA-Z0-9_]*)
+  | (?P<PAREN>[()])
+  | (?P<NUMBER>-?\d+(?:\.\d+)?)
+  | '(?P<SQUOTE>[^']*)'
+  | "(?P<DQUOTE>[^"]*)"
+  | (?P<ERROR>\S)
+)""", re.VERBOSE)
+
+_OPERATORS = {
+    "and": Operator.AND,
+    "or": Operator.OR,
+    "not": Operator.NOT_EQUALS,
+    ">=": Operator.GREATER_THAN_OR_EQUAL,
+    "<=": Operator.LESS_THAN_OR_EQUAL,
+    "==": Operator.EQUALS,
+    "!=": Operator.NOT_EQUALS,
+    ">": Operator.GREATER_THAN,
+    "<": Operator.LESS_THAN,
+}
+
+def _scan_error(condition: str, position: int) -> ConditionValidationError:
+    """Error for a character no token can start with."""
+    char = condition[position]
+    if char in '&|=!><aon':  # 'a', 'o', 'n' start 'and', 'or', 'not'
+        reason = "Invalid operator"
+    elif char.isalpha():
+        reason = "Invalid identifier"
+    elif char.isdigit() or char == '-':
+        reason = "Invalid number"
+    elif char in '\'"':
+        reason = "Unclosed string"
+    else:
+        reason = "Unexpected character"
+    return ConditionValidationError(f"{reason} at position {position}")
+
 def _tokenize(condition: str) -> list[Token]:
     """
     Convert condition string into a list of tokens.
@@ -137,103 +220,55 @@ def _tokenize(condition: str) -> list[Token]:
     """
     MAX_TOKENS = 100
     tokens = []
-    i = 0
     
     # JS-style condition support fix: Normalize condition before tokenizing
     condition = normalize_condition(condition)
     
-    while i < len(condition):
+    # Normalized conditions have no trailing whitespace, so the matches
+    # cover the whole string. Names and string literals are interned: they
+    # live on in the token cache and are compared against context keys and
+    # values, where identical objects compare without a character scan.
+    for match in _TOKEN_RE.finditer(condition):
         if len(tokens) >= MAX_TOKENS:
             raise ConditionValidationError(
                 f"Condition exceeds maximum token limit of {MAX_TOKENS}"
             )
             
-        char = condition[i]
-        
-        # Skip whitespace
-        if char.isspace():
-            i += 1
-            continue
-            
-        # Handle operators
-        if char in ['&', '|', '=', '!', '>', '<', 'a', 'o', 'n']:  # Added 'a', 'o', 'n' for 'and', 'or', 'not'
-            # Check for word operators first
-            if condition[i:i+3] == 'and':
-                tokens.append(Token(TokenType.OPERATOR, Operator.AND))
-                i += 3
-            elif condition[i:i+2] == 'or':
-                tokens.append(Token(TokenType.OPERATOR, Operator.OR))
-                i += 2
-            elif condition[i:i+3] == 'not':
-                tokens.append(Token(TokenType.OPERATOR, Operator.NOT_EQUALS))
-                i += 3
-            # Then check for compound operators
-            elif i + 1 < len(condition) and condition[i:i+2] == '>=':
-                tokens.append(Token(TokenType.OPERATOR, Operator.GREATER_THAN_OR_EQUAL))
-                i += 2
-            elif i + 1 < len(condition) and condition[i:i+2] == '<=':
-                tokens.append(Token(TokenType.OPERATOR, Operator.LESS_THAN_OR_EQUAL))
-                i += 2
-            elif i + 1 < len(condition) and condition[i:i+2] == '==':
-                tokens.append(Token(TokenType.OPERATOR, Operator.EQUALS))
-                i += 2
-            elif i + 1 < len(condition) and condition[i:i+2] == '!=':
-                tokens.append(Token(TokenType.OPERATOR, Operator.NOT_EQUALS))
-                i += 2
-            # Then check for single-char operators
-            elif char == '>':
-                tokens.append(Token(TokenType.OPERATOR, Operator.GREATER_THAN))
-                i += 1
-            elif char == '<':
-                tokens.append(Token(TokenType.OPERATOR, Operator.LESS_THAN))
-                i += 1
-            else:
-                # If it's not an operator, treat it as a potential identifier
-                match = re.match(r'[a-zA-Z_][a-zA-Z0-9_]*', condition[i:])
-                if match:
-                    tokens.append(Token(TokenType.VALUE, match.group()))
-                    i += len(match.group())
-                else:
-                    raise ConditionValidationError(f"Invalid operator at position {i}")
-                
-        # Handle parentheses
-        elif char in ['(', ')']:
-            tokens.append(Token(TokenType.PAREN, char))
-            i += 1
-            
-        # Handle values (identifiers, numbers, strings)
-        else:
-            # Match identifiers, numbers, or strings
-            if char.isalpha():
-                # Match identifier - must start with letter
-                match = re.match(r'[a-zA-Z_][a-zA-Z0-9_]*', condition[i:])
-                if not match:
-                    raise ConditionValidationError(f"Invalid identifier at position {i}")
-                tokens.append(Token(TokenType.VALUE, match.group()))
-                i += len(match.group())
-            elif char.isdigit() or char == '-':
-                # Match number - must be full match
-                match = re.match(r'-?\d+(\.\d+)?', condition[i:])
-                if not match:
-                    raise ConditionValidationError(f"Invalid number at position {i}")
-                tokens.append(Token(TokenType.VALUE, float(match.group())))
-                i += len(match.group())
-            elif char == "'" or char == '"':
-                # Match string literal
-                quote = char
-                i += 1
-                start = i
-                while i < len(condition) and condition[i] != quote:
-                    i += 1
-                if i >= len(condition):
-                    raise ConditionValidationError(f"Unclosed string at position {start-1}")
-                tokens.append(Token(TokenType.LITERAL, condition[start:i]))
-                i += 1
-            else:
-                raise ConditionValidationError(f"Unexpected character at position {i}")
+        kind = match.lastgroup
+        if kind == "OPERATOR":
+            tokens.append(Token(TokenType.OPERATOR, _OPERATORS[match.group(kind)]))
+        elif kind == "IDENT":
+            tokens.append(Token(TokenType.VALUE, sys.intern(match.group(kind))))
+        elif kind == "NUMBER":
+            tokens.append(Token(TokenType.VALUE, float(match.group(kind))))
+        elif kind == "PAREN":
+            tokens.append(Token(TokenType.PAREN, match.group(kind)))
+        elif kind == "ERROR":
+            raise _scan_error(condition, match.start(kind))
+        else:  # SQUOTE / DQUOTE
+            tokens.append(Token(TokenType.LITERAL, sys.intern(match.group(kind))))
                 
     return tokens
 
+@functools.lru_cache(maxsize=_CONDITION_CACHE_SIZE)
+def _parse(condition: str) -> Tuple[Token, ...]:
+    """
+    Normalize and tokenize a condition string, memoized per string.
+    
+    Conditions that fail to tokenize are not cached and raise again on
+    every call.
+    """
+    return tuple(_tokenize(normalize_condition(condition)))
+
+def clear_condition_cache() -> None:
+    """Drop memoized condition tokens and results (e.g. between tests)."""
+    _parse.cache_clear()
+    _evaluate_frozen.cache_clear()
+
+def condition_cache_info():
+    """Hit/miss statistics for the condition token cache."""
+    return _parse.cache_info()
+
 def _find_matching_paren(tokens: List[Token], start: int) -> int:
     """Find the matching closing parenthesis."""
     count = 1
@@ -249,6 +284,23 @@ def _find_matching_paren(tokens: List[Token], start: int) -> int:
         i += 1
     raise ValueError("Unmatched parenthesis")
 
+def _split_logical(tokens: List[Token]) -> Optional[int]:
+    """
+    Index of the AND/OR operator an expression is split at, if any.
+    
+    Returns None for an empty or fully parenthesized expression, which are
+    evaluated whole.
+    """
+    if not tokens:
+        return None
+    if tokens[0].type == TokenType.PAREN and tokens[0].value == '(':
+        if _find_matching_paren(tokens, 0) == len(tokens) - 1:
+            return None
+    for i, token in enumerate(tokens):
+        if token.type == TokenType.OPERATOR and token.value in (Operator.AND, Operator.OR):
+            return i
+    return None
+
 def _evaluate_expression(
     tokens: List[Token], 
     context: Dict[str, Any],
@@ -288,26 +340,46 @@ def _evaluate_expression(
         if end == len(tokens) - 1:
             return _evaluate_expression(tokens[1:end], context, visited_fields, depth + 1)
             
-    # Handle AND/OR operations before comparisons
-    for i in range(len(tokens)):
-        if tokens[i].type == TokenType.OPERATOR and tokens[i].value in [Operator.AND, Operator.OR]:
+    # Handle AND/OR operations before comparisons. A chain "a op b op c" is
+    # split at its first operator with the remainder as the right operand,
+    # i.e. a op (b op c); walk the links in a loop rather than recursing once
+    # per operator. Every operand is evaluated even once the result is
+    # known, so a missing or invalid field anywhere in the chain still fails
+    # the condition.
+    split = _split_logical(tokens)
+    if split is not None:
+        links = []
+        explanation_parts = []
+        rest = tokens
+        link_depth = depth
+        while split is not None:
+            op = rest[split].value
+            link_depth += 1
             # JS-style condition support fix: Evaluate AND/OR before comparisons
             try:
                 left_result, left_explanation = _evaluate_expression(
-                    tokens[:i], context, visited_fields.copy(), depth + 1
-                )
-                right_result, right_explanation = _evaluate_expression(
-                    tokens[i+1:], context, visited_fields.copy(), depth + 1
+                    rest[:split], context, visited_fields.copy(), link_depth
                 )
+                links.append((left_result, op))
+                explanation_parts.append(left_explanation)
+                explanation_parts.append(op.name)
                 
-                if tokens[i].value == Operator.AND:
-                    result = left_result and right_result
-                    return result, f"{left_explanation} AND {right_explanation}"
-                else:  # OR
-                    result = left_result or right_result
-                    return result, f"{left_explanation} OR {right_explanation}"
+                rest = rest[split + 1:]
+                split = _split_logical(rest)
+                if split is None:
+                    result, explanation = _evaluate_expression(
+                        rest, context, visited_fields.copy(), link_depth
+                    )
             except Exception as e:
-                raise ValueError(f"Failed to evaluate {tokens[i].value.name} operation: {str(e)}")
+                raise ValueError(f"Failed to evaluate {op.name} operation: {str(e)}")
+        
+        explanation_parts.append(explanation)
+        for left_result, op in reversed(links):
+            if op == Operator.AND:
+                result = left_result and result
+            else:  # OR
+                result = left_result or result
+        return result, " ".join(explanation_parts)
             
     # Handle single value
     if len(tokens) == 1:
@@ -317,9 +389,11 @@ def _evaluate_expression(
         if tokens[0].type == TokenType.VALUE and isinstance(value, str):
             if value in visited_fields:
                 raise CircularReferenceError(value, list(visited_fields))
-            if value in context:
+            found = context.get(value, _MISSING)
+            if found is not _MISSING:
                 visited_fields.add(value)
-                return bool(context[value]), f"Context value '{value}' is {bool(context[value])}"
+                found = bool(found)
+                return found, f"Context value '{value}' is {found}"
             # JS-style condition support fix: Better error for missing context keys
             raise ValueError(f"Context key '{value}' not found in {list(context.keys())}")
         return bool(value), f"Value {value} is {bool(value)}"
@@ -334,13 +408,14 @@ def _evaluate_expression(
         if tokens[0].type == TokenType.VALUE and isinstance(left, str):
             if left in visited_fields:
                 raise CircularReferenceError(left, list(visited_fields))
-            if left in context:
+            found = context.get(left, _MISSING)
+            if found is not _MISSING:
                 visited_fields.add(left)
                 left_display = f"{tokens[0].value}"
-                left_value = context[left]
+                left_value = found
                 if isinstance(left_value, str):
                     left_value = f"'{left_value}'"
-                left = context[left]
+                left = found
             else:
                 # JS-style condition support fix: Better error for missing context keys
                 raise ValueError(f"Context key '{left}' not found in {list(context.keys())}")
@@ -354,13 +429,14 @@ def _evaluate_expression(
         if tokens[2].type == TokenType.VALUE and isinstance(right, str):
             if right in visited_fields:
                 raise CircularReferenceError(right, list(visited_fields))
-            if right in context:
+            found = context.get(right, _MISSING)
+            if found is not _MISSING:
                 visited_fields.add(right)
                 right_display = f"{tokens[2].value}"
-                right_value = context[right]
+                right_value = found
                 if isinstance(right_value, str):
                     right_value = f"'{right_value}'"
-                right = context[right]
+                right = found
             else:
                 # JS-style condition support fix: Better error for missing context keys
                 raise ValueError(f"Context key '{right}' not found in {list(context.keys())}")
@@ -371,35 +447,26 @@ def _evaluate_expression(
                 right_value = f"'{right_value}'"
             
         # Validate numeric comparisons
-        if op in [Operator.GREATER_THAN, Operator.LESS_THAN, Operator.GREATER_THAN_OR_EQUAL, Operator.LESS_THAN_OR_EQUAL]:
+        if op in _ORDERING_OPERATORS:
+            # Number literals were already parsed to float by the tokenizer;
+            # only context values and quoted literals need checking
             try:
-                left = _validate_numeric(left, tokens[0].value)
-                right = _validate_numeric(right, tokens[2].value)
+                if not _is_number_literal(tokens[0]):
+                    left = _validate_numeric(left, tokens[0].value)
+                if not _is_number_literal(tokens[2]):
+                    right = _validate_numeric(right, tokens[2].value)
             except ValueError as e:
                 raise ValueError(f"Invalid comparison: {str(e)}")
             
         # Perform comparison
-        if op == Operator.EQUALS:
-            result = left == right
-            if not result and tokens[0].value == "role":
+        comparison = _COMPARISONS.get(op)
+        if comparison is not None:
+            compare, symbol = comparison
+            result = compare(left, right)
+            if op == Operator.EQUALS and not result and tokens[0].value == "role":
                 # For role comparison failures, show as not equals
-                return result, f"{left_display} {left_value} != {right_value}"
-            return result, f"{left_display} {left_value} == {right_value}"
-        elif op == Operator.NOT_EQUALS:
-            result = left != right
-            return result, f"{left_display} {left_value} != {right_value}"
-        elif op == Operator.GREATER_THAN:
-            result = left > right
-            return result, f"{left_display} {left_value} > {right_value}"
-        elif op == Operator.LESS_THAN:
-            result = left < right
-            return result, f"{left_display} {left_value} < {right_value}"
-        elif op == Operator.GREATER_THAN_OR_EQUAL:
-            result = left >= right
-            return result, f"{left_display} {left_value} >= {right_value}"
-        elif op == Operator.LESS_THAN_OR_EQUAL:
-            result = left <= right
-            return result, f"{left_display} {left_value} <= {right_value}"
+                symbol = "!="
+            return result, f"{left_display} {left_value} {symbol} {right_value}"
             
     raise ValueError("Invalid expression structure")
 
@@ -411,6 +478,9 @@ def evaluate_condition(
     """
     Evaluate a condition string using the provided context.
     
+    Results are memoized per (condition, context) when the context values
+    are hashable and no visited_fields set is passed in.
+    
     Args:
         condition: String containing the condition to evaluate
         context: Dictionary containing context values
@@ -432,11 +502,44 @@ def evaluate_condition(
     if condition.isspace():
         raise InvalidConditionError("Condition cannot be whitespace only")
         
+    if visited_fields is None:
+        try:
+            frozen_context = _freeze_context(context)
+        except TypeError:
+            pass  # unhashable context values, evaluate without the cache
+        else:
+            result, explanation, fields_affected = _evaluate_frozen(condition, frozen_context)
+            return result, explanation, list(fields_affected)
+    return _evaluate(condition, context, visited_fields)
+
+def _freeze_context(context: Dict[str, Any]) -> Tuple:
+    """
+    Build a hashable cache key from a context dict.
+    
+    Each value's type is part of the key: True, 1 and 1.0 hash alike but
+    evaluate and explain differently. Raises TypeError for unhashable values.
+    """
+    key = tuple((name, value.__class__, value) for name, value in context.items())
+    hash(key)
+    return key
+
+@functools.lru_cache(maxsize=_RESULT_CACHE_SIZE)
+def _evaluate_frozen(condition: str, frozen_context: Tuple) -> Tuple[bool, str, Tuple[str, ...]]:
+    """Memoized evaluation against a context frozen by _freeze_context."""
+    context = {name: value for name, _, value in frozen_context}
+    result, explanation, fields_affected = _evaluate(condition, context, None)
+    return result, explanation, tuple(fields_affected)
+
+def _evaluate(
+    condition: str,
+    context: Dict[str, Any],
+    visited_fields: Optional[Set[str]]
+) -> Tuple[bool, str, List[str]]:
+    """Evaluate a validated condition string without the result cache."""
     # JS-style condition support fix: Normalize condition before evaluation
     original_condition = condition
     try:
-        condition = normalize_condition(condition)
-        tokens = _tokenize(condition)
+        tokens = _parse(condition)
         if not tokens:
             raise InvalidConditionError("Condition produced no valid tokens")
             
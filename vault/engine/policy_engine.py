@@ -2,12 +2,17 @@
 Policy engine for evaluating conditions against context.
 """
 
+import functools
+import os
 from typing import Any, Dict, List, Optional, Tuple, Union, NamedTuple
 
 from pydantic import BaseModel
 
 from .condition_evaluator import evaluate_condition, InvalidConditionError
-from .policy_parser import parse_policy
+from .policy_parser import parse_policy, Policy
+
+# Distinct policy file versions whose parsed Policy is kept
+_POLICY_CACHE_SIZE = 128
 
 class ConditionResult(NamedTuple):
     """Result of a single condition evaluation."""
@@ -27,19 +32,51 @@ class EvaluationResult(BaseModel):
     failed_conditions: List[str] = []
     unmask_role_override: bool = False
 
-def evaluate(context: Dict[str, Any], policy_path: str) -> EvaluationResult:
+@functools.lru_cache(maxsize=_POLICY_CACHE_SIZE)
+def _load_policy(path: str, inode: int, mtime_ns: int, size: int) -> Policy:
+    """
+    Parse a policy file, memoized per file version.
+    
+    The stat fields are only part of the key, so editing or replacing the
+    file makes the next call parse it again. Files that fail to parse are
+    not cached and raise again on every call.
+    """
+    return parse_policy(path)
+
+def _get_policy(policy_path: str) -> Policy:
+    """Parsed policy for a path, reusing the result while the file is unchanged."""
+    try:
+        stat = os.stat(policy_path)
+    except (OSError, ValueError):
+        # Let the parser report the missing or invalid path
+        return parse_policy(policy_path)
+    return _load_policy(os.path.abspath(policy_path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def clear_policy_cache() -> None:
+    """Drop memoized policies (e.g. between tests)."""
+    _load_policy.cache_clear()
+
+def policy_cache_info():
+    """Hit/miss statistics for the parsed policy cache."""
+    return _load_policy.cache_info()
+
+def evaluate(context: Dict[str, Any], policy_path: Union[str, Policy]) -> EvaluationResult:
     """
     Evaluate a policy against a context.
     
     Args:
         context: Dictionary containing role, trustScore, etc.
-        policy_path: Path to policy file
+        policy_path: Path to policy file, or an already parsed Policy.
+            Parsed files are cached until they change on disk.
         
     Returns:
         EvaluationResult with success/failure and reason
     """
     # Parse policy
-    policy = parse_policy(policy_path)
+    if isinstance(policy_path, Policy):
+        policy = policy_path
+    else:
+        policy = _get_policy(policy_path)
     
     # Check role - if in unmask_roles, skip condition evaluation entirely
     if context.get("role") in policy.unmask_roles:
@@ -0,0 +1,47 @@
+"""
+JSON decoding with an optional fast path.
+
+Uses orjson when it is installed (the "fast" extra) and the standard
+library otherwise. Input orjson rejects but the standard library accepts,
+such as NaN/Infinity literals, is handed to the standard library. orjson
+does not reject integers outside the 64-bit range; it silently decodes
+them as floats. Documents containing a run of 19 or more digits, the
+shortest literal that can fall outside that range, therefore go straight
+to the standard library, so what gets decoded never depends on which
+backend is installed.
+"""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, install with the "fast" extra
+    orjson = None
+
+# 19+ digits: every integer orjson would decode as a float has at least 19
+_LONG_DIGITS = re.compile("[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(b"[0-9]{19}")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON text, as str or UTF-8 bytes
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    long_digits = _LONG_DIGITS if isinstance(data, str) else _LONG_DIGITS_BYTES
+    if orjson is not None and not long_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
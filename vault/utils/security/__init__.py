@@ -14,6 +14,7 @@ from .validators import (
     validate_trust_score,
     SecurityValidationError,
     validate_json_depth,
+    clear_validation_cache,
 )
 
 from .runtime_bypass import (
@@ -41,6 +42,7 @@ __all__ = [
     'validate_trust_score',
     'SecurityValidationError',
     'validate_json_depth',
+    'clear_validation_cache',
     'bypass_validation',
     'is_bypass_active',
     'BypassContext',
@@ -140,6 +140,22 @@ ERROR_MESSAGES = {
 }
 
 
+# Category for each error code, derived once from the code's numeric band
+_CATEGORY_BY_PREFIX = {
+    "E0": ErrorCategory.TYPE_ERROR,
+    "E1": ErrorCategory.MISSING_FIELD,
+    "E2": ErrorCategory.INJECTION_ATTACK,
+    "E3": ErrorCategory.DOS_ATTACK,
+    "E4": ErrorCategory.INVALID_VALUE,
+    "E5": ErrorCategory.SIZE_LIMIT,
+    "E6": ErrorCategory.DEPTH_LIMIT,
+}
+_CODE_CATEGORIES = {
+    code: _CATEGORY_BY_PREFIX.get(code.value[:2], ErrorCategory.INVALID_VALUE)
+    for code in ErrorCode
+}
+
+
 def create_error(
     code: ErrorCode,
     field: Optional[str] = None,
@@ -149,23 +165,7 @@ def create_error(
 ) -> ValidationError:
     """Create a structured validation error."""
     # Determine category from code
-    code_value = code.value
-    if code_value.startswith("E0"):
-        category = ErrorCategory.TYPE_ERROR
-    elif code_value.startswith("E1"):
-        category = ErrorCategory.MISSING_FIELD
-    elif code_value.startswith("E2"):
-        category = ErrorCategory.INJECTION_ATTACK
-    elif code_value.startswith("E3"):
-        category = ErrorCategory.DOS_ATTACK
-    elif code_value.startswith("E4"):
-        category = ErrorCategory.INVALID_VALUE
-    elif code_value.startswith("E5"):
-        category = ErrorCategory.SIZE_LIMIT
-    elif code_value.startswith("E6"):
-        category = ErrorCategory.DEPTH_LIMIT
-    else:
-        category = ErrorCategory.INVALID_VALUE
+    category = _CODE_CATEGORIES.get(code, ErrorCategory.INVALID_VALUE)
     
     # Generate message
     if custom_message:
@@ -83,17 +83,20 @@ class BypassManager:
         # Import here to avoid circular dependency
         from .monitoring import record_bypass_use
         
+        # Snapshot once for both the audit log and metrics
+        bypass_info = bypass.to_dict()
+        
         with self._lock:
             if global_bypass:
                 self._global_bypass = bypass
-                logger.critical(f"GLOBAL validation bypass activated: {bypass.to_dict()}")
+                logger.critical(f"GLOBAL validation bypass activated: {bypass_info}")
             else:
                 thread_id = threading.get_ident()
                 self._bypasses[thread_id] = bypass
-                logger.warning(f"Thread validation bypass activated: {bypass.to_dict()}")
+                logger.warning(f"Thread validation bypass activated: {bypass_info}")
         
         # Record bypass in metrics
-        record_bypass_use(bypass.to_dict())
+        record_bypass_use(bypass_info)
         
         return bypass
     
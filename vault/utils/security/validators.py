@@ -8,6 +8,7 @@ This module implements security-first validation that:
 4. Provides clear error messages
 """
 
+import functools
 import math
 import unicodedata
 import re
@@ -28,6 +29,26 @@ MAX_CONTENT_SIZE = 1 * 1024 * 1024  # 1MB (reduced from 10MB based on analysis)
 MAX_STRING_LENGTH = 10 * 1024  # 10KB for individual strings (10240 bytes)
 MAX_JSON_DEPTH = 100  # Prevent deeply nested JSON DoS
 
+# Defaults returned while a validation bypass is active
+_BYPASS_DEFAULT_ROLE = "anonymous"
+_BYPASS_DEFAULT_CONTEXT = {"role": _BYPASS_DEFAULT_ROLE, "trustScore": 0.0}
+
+# Plain decimal or scientific notation (no hex/octal, separators or symbols)
+_NUMERIC_STRING_RE = re.compile(r"^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$")
+
+# Context keys validated by dedicated checks before the generic field loop
+_SECURITY_FIELDS = frozenset({"role", "trustScore"})
+
+# Keys dropped to prevent prototype pollution in downstream JS consumers
+_PROTOTYPE_POLLUTION_KEYS = frozenset({"__proto__", "constructor", "prototype"})
+
+# Value types whose validation results are safe to memoize. Strings longer
+# than _CACHEABLE_STR_LENGTH are validated uncached, so the cache stays
+# small however large the untrusted input is
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+_CACHEABLE_STR_LENGTH = 128
+_VALIDATION_CACHE_SIZE = 1024
+
 # High-privilege roles that need extra logging
 HIGH_PRIVILEGE_ROLES = {
     'admin', 'administrator', 'root', 'superuser', 
@@ -71,6 +92,13 @@ INJECTION_PATTERNS = [
     (r"__(proto|constructor|prototype)__", "Prototype pollution"),
 ]
 
+# Compile once at import so the first validation doesn't pay for
+# populating the re module cache with every pattern
+_COMPILED_INJECTION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), attack_type)
+    for pattern, attack_type in INJECTION_PATTERNS
+]
+
 
 # Use ValidationError from error_taxonomy instead
 SecurityValidationError = ValidationError
@@ -102,8 +130,47 @@ def validate_role(role: Any, source: str = "agent") -> str:
     # Check bypass
     if is_bypass_active():
         logger.warning(f"Role validation bypassed for {source}")
-        return str(role) if role is not None else "anonymous"
+        return str(role) if role is not None else _BYPASS_DEFAULT_ROLE
     
+    return _validate_role(role, source)
+
+
+def _normalize_unicode(value: str) -> str:
+    """NFKC-normalize a string, skipping the work for pure ASCII input.
+    
+    ASCII text is already in NFKC form, and ``str.isascii`` is a constant-time
+    flag check, so the common case never walks the string.
+    """
+    if value.isascii():
+        return value
+    return unicodedata.normalize('NFKC', value)
+
+
+def _is_cacheable(value: Any) -> bool:
+    """Whether a scalar is small enough to key a validation cache entry."""
+    if type(value) is str:
+        return len(value) <= _CACHEABLE_STR_LENGTH
+    return type(value) in _CACHEABLE_TYPES
+
+
+def _validate_role(role: Any, source: str) -> str:
+    """Role checks without bypass or metrics handling (see validate_role)."""
+    if _is_cacheable(role):
+        normalized_role = _check_role_cached(role, source)
+    else:
+        normalized_role = _check_role(role, source)
+    
+    # Logged on every call, so what is logged never depends on cache state
+    stripped_role = role.strip()
+    if normalized_role != stripped_role:
+        logger.info(f"Unicode normalization applied to role: {repr(stripped_role)} -> {repr(normalized_role)}")
+    _log_high_privilege_role(normalized_role, source)
+    
+    return normalized_role
+
+
+def _check_role(role: Any, source: str) -> str:
+    """Pure role checks behind _validate_role; they log nothing."""
     # Null check with clear error
     if role is None:
         raise create_error(ErrorCode.FIELD_REQUIRED, field=f"{source} role")
@@ -118,9 +185,7 @@ def validate_role(role: Any, source: str = "agent") -> str:
         raise create_error(ErrorCode.FIELD_EMPTY, field=f"{source} role")
     
     # Unicode normalization (prevent homograph attacks)
-    normalized_role = unicodedata.normalize('NFKC', stripped_role)
-    if normalized_role != stripped_role:
-        logger.info(f"Unicode normalization applied to role: {repr(stripped_role)} -> {repr(normalized_role)}")
+    normalized_role = _normalize_unicode(stripped_role)
     
     # Length check
     if len(normalized_role) > 100:
@@ -132,8 +197,8 @@ def validate_role(role: Any, source: str = "agent") -> str:
     
     # Injection pattern check
     role_lower = normalized_role.lower()
-    for pattern, attack_type in INJECTION_PATTERNS:
-        if re.search(pattern, role_lower, re.IGNORECASE):
+    for pattern, attack_type in _COMPILED_INJECTION_PATTERNS:
+        if pattern.search(role_lower):
             # Map attack types to error codes
             error_code = ErrorCode.INJECTION_SQL  # Default
             if "null byte" in attack_type.lower():
@@ -153,13 +218,22 @@ def validate_role(role: Any, source: str = "agent") -> str:
                 details={"pattern": attack_type, "value_snippet": role_lower[:50]}
             )
     
-    # Log high-privilege role requests
-    if normalized_role.lower() in HIGH_PRIVILEGE_ROLES:
-        logger.warning(f"High-privilege role requested: {normalized_role} from {source}")
-    
     return normalized_role
 
 
+# typed=True keeps e.g. 1 and True apart so both still fail the type check
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE, typed=True)
+def _check_role_cached(role: Any, source: str) -> str:
+    """Memoized _check_role for small scalar roles."""
+    return _check_role(role, source)
+
+
+def _log_high_privilege_role(role: str, source: str) -> None:
+    """Log high-privilege role requests."""
+    if role.lower() in HIGH_PRIVILEGE_ROLES:
+        logger.warning(f"High-privilege role requested: {role} from {source}")
+
+
 @monitor_validation("trustScore") 
 def validate_trust_score(score: Any, required: bool = True, source: str = "agent") -> Optional[float]:
     """
@@ -192,14 +266,27 @@ def validate_trust_score(score: Any, required: bool = True, source: str = "agent
         except:
             return 0.0
     
+    return _validate_trust_score(score, required, source)
+
+
+def _validate_trust_score(score: Any, required: bool, source: str) -> Optional[float]:
+    """Trust score checks without bypass or metrics handling (see validate_trust_score)."""
+    if _is_cacheable(score):
+        return _check_trust_score_cached(score, required, source)
+    return _check_trust_score(score, required, source)
+
+
+def _check_trust_score(score: Any, required: bool, source: str) -> Optional[float]:
+    """Pure trust score checks behind _validate_trust_score."""
     # Handle missing score
     if score is None:
         if required:
             raise create_error(ErrorCode.FIELD_REQUIRED, field=f"{source} trustScore")
         return None
     
-    # Reject boolean explicitly (Python treats True as 1, False as 0)
-    if isinstance(score, bool):
+    # Reject boolean explicitly (Python treats True as 1, False as 0).
+    # bool can't be subclassed, so an identity check on the type is exact.
+    if type(score) is bool:
         raise create_error(
             ErrorCode.VALUE_SPECIAL_NUMBER,
             field=f"{source} trustScore", 
@@ -223,14 +310,14 @@ def validate_trust_score(score: Any, required: bool = True, source: str = "agent
                 value="NaN"
             )
         
-        # Try conversion
-        try:
-            numeric_score = float(score)
-        except ValueError:
+        # Reject non-decimal strings up front; anything that matches can't
+        # make float() raise (overflow becomes inf, caught below)
+        if _NUMERIC_STRING_RE.match(score) is None:
             raise create_error(
                 ErrorCode.TYPE_NUMBER_EXPECTED,
                 field=f"{source} trustScore"
             )
+        numeric_score = float(score)
     elif isinstance(score, (int, float)):
         numeric_score = float(score)
     else:
@@ -239,18 +326,12 @@ def validate_trust_score(score: Any, required: bool = True, source: str = "agent
             field=f"{source} trustScore"
         )
     
-    # Check for special float values
-    if math.isnan(numeric_score):
-        raise create_error(
-            ErrorCode.VALUE_SPECIAL_NUMBER,
-            field=f"{source} trustScore",
-            value="NaN"
-        )
-    if math.isinf(numeric_score):
+    # Check for special float values (NaN is the only value unequal to itself)
+    if not math.isfinite(numeric_score):
         raise create_error(
             ErrorCode.VALUE_SPECIAL_NUMBER,
             field=f"{source} trustScore",
-            value="Infinity"
+            value="NaN" if numeric_score != numeric_score else "Infinity"
         )
     
     # Range validation
@@ -265,6 +346,13 @@ def validate_trust_score(score: Any, required: bool = True, source: str = "agent
     return numeric_score
 
 
+# typed=True keeps True, 1 and 1.0 apart so booleans are still rejected
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE, typed=True)
+def _check_trust_score_cached(score: Any, required: bool, source: str) -> Optional[float]:
+    """Memoized _check_trust_score for small scalar scores."""
+    return _check_trust_score(score, required, source)
+
+
 @monitor_validation("context")
 def validate_agent_context(context: Any, source: str = "agent") -> Dict[str, Any]:
     """
@@ -292,9 +380,15 @@ def validate_agent_context(context: Any, source: str = "agent") -> Dict[str, Any
     if is_bypass_active():
         logger.warning(f"Context validation bypassed for {source}")
         if not isinstance(context, dict):
-            return {"role": "anonymous", "trustScore": 0.0}
+            # Copy so callers can't mutate the shared default
+            return _BYPASS_DEFAULT_CONTEXT.copy()
         return context
     
+    return _validate_agent_context(context, source)
+
+
+def _validate_agent_context(context: Any, source: str) -> Dict[str, Any]:
+    """Context checks without bypass or metrics handling (see validate_agent_context)."""
     # Type validation
     if not isinstance(context, dict):
         raise create_error(
@@ -327,7 +421,9 @@ def validate_agent_context(context: Any, source: str = "agent") -> Dict[str, Any
             ErrorCode.FIELD_REQUIRED,
             field=f"{source}.role"
         )
-    validated["role"] = validate_role(context["role"], source)
+    # Bypass was already checked above, so call the checks directly and
+    # record a single "context" metric rather than one per field
+    validated["role"] = _validate_role(context["role"], source)
     
     # Validate trustScore
     if source == "agent":  # simulate command
@@ -336,20 +432,26 @@ def validate_agent_context(context: Any, source: str = "agent") -> Dict[str, Any
                 ErrorCode.FIELD_REQUIRED,
                 field=f"{source}.trustScore"
             )
-        validated["trustScore"] = validate_trust_score(context["trustScore"], required=True, source=source)
+        validated["trustScore"] = _validate_trust_score(context["trustScore"], required=True, source=source)
     elif source == "agent-redact":  # redact command
         if "trustScore" in context:
-            score = validate_trust_score(context["trustScore"], required=False, source=source)
+            score = _validate_trust_score(context["trustScore"], required=False, source=source)
             if score is not None:
                 validated["trustScore"] = score
     
+    # Common case: nothing but role/trustScore. Both were checked above and
+    # the result is flat and bounded (role <= 100 chars), so the generic
+    # field loop, depth walk and final size check have nothing to do.
+    if context.keys() <= _SECURITY_FIELDS:
+        return validated
+    
     # Validate other fields
     for key, value in context.items():
-        if key in ["role", "trustScore"]:
+        if key in _SECURITY_FIELDS:
             continue
         
         # Prevent prototype pollution
-        if key in ["__proto__", "constructor", "prototype"]:
+        if key in _PROTOTYPE_POLLUTION_KEYS:
             logger.warning(f"Prototype pollution attempt blocked: {key}")
             continue
         
@@ -363,12 +465,12 @@ def validate_agent_context(context: Any, source: str = "agent") -> Dict[str, Any
                 )
             
             # Normalize unicode
-            normalized = unicodedata.normalize('NFKC', value)
+            normalized = _normalize_unicode(value)
             
             # Check for injection in string fields
             value_lower = normalized.lower()
-            for pattern, attack_type in INJECTION_PATTERNS:
-                if re.search(pattern, value_lower, re.IGNORECASE):
+            for pattern, attack_type in _COMPILED_INJECTION_PATTERNS:
+                if pattern.search(value_lower):
                     # Map attack types to error codes
                     error_code = ErrorCode.INJECTION_SQL
                     if "XSS" in attack_type:
@@ -438,12 +540,12 @@ def validate_nested_value(value: Any, path: str, current_depth: int = 0) -> Any:
             )
         
         # Normalize unicode
-        normalized = unicodedata.normalize('NFKC', value)
+        normalized = _normalize_unicode(value)
         
         # Check for injection
         value_lower = normalized.lower()
-        for pattern, attack_type in INJECTION_PATTERNS:
-            if re.search(pattern, value_lower, re.IGNORECASE):
+        for pattern, attack_type in _COMPILED_INJECTION_PATTERNS:
+            if pattern.search(value_lower):
                 # Map attack types to error codes
                 error_code = ErrorCode.INJECTION_SQL  # Default
                 if "null byte" in attack_type.lower():
@@ -470,7 +572,7 @@ def validate_nested_value(value: Any, path: str, current_depth: int = 0) -> Any:
         validated_dict = {}
         for key, val in value.items():
             # Prevent prototype pollution
-            if key in ["__proto__", "constructor", "prototype"]:
+            if key in _PROTOTYPE_POLLUTION_KEYS:
                 logger.warning(f"Prototype pollution attempt blocked: {key} at {path}")
                 continue
             
@@ -511,4 +613,10 @@ def validate_json_depth(obj: Any, current_depth: int = 0, max_depth: int = MAX_J
             validate_json_depth(value, current_depth + 1, max_depth)
     elif isinstance(obj, list):
         for item in obj:
-            validate_json_depth(item, current_depth + 1, max_depth)
\ No newline at end of file
+            validate_json_depth(item, current_depth + 1, max_depth)
+
+
+def clear_validation_cache() -> None:
+    """Drop memoized validation results (e.g. between tests)."""
+    _check_role_cached.cache_clear()
+    _check_trust_score_cached.cache_clear()